@@ -10,16 +10,22 @@ if __name__ == "__main__":
   parser = argparse.ArgumentParser()
   parser.add_argument("-n", type=int, default=1000, help="Number of trials")
   parser.add_argument("weights", help="Weights to use when running the simulation", choices=sorted(list(al.config.weights.keys())))
+  parser.add_argument("--ignore-cooldown", action="store_true", help="Draw all trials at once, ignoring reselection cooldowns")
   args = parser.parse_args()
 
-  log = []
-  for n in range(args.n):
-    intro, walk, outro = al.select_animation_sequence(weights=al.config.weights[args.weights], verbose=False)
-    log.append([walk.image, walk.category])
+  weights = al.config.weights[args.weights]
+  if args.ignore_cooldown:
+    walks, categories = al.simulate(args.n, weights)
+  else:
+    walks = [None] * args.n
+    categories = [None] * args.n
+    for n in range(args.n):
+      intro, walk, outro = al.select_animation_sequence(weights=weights, verbose=False)
+      walks[n] = walk.image
+      categories[n] = walk.category
+  df = pl.DataFrame({"walk": walks, "category": categories}).with_row_index()
   print(f"Simulation for {args.weights}")
 
-  df = pl.DataFrame(log, orient='row', schema=['walk','category']).with_row_index()
-
   cats = df['category'].value_counts().sort('count', descending=True)
   cats = cats.with_columns(pct=pl.col('count')/pl.col('count').sum())
   print(cats.head(10))
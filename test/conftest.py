@@ -0,0 +1,9 @@
+import pytest
+
+from xwalk2.animation_library import AnimationLibrary
+
+
+@pytest.fixture(autouse=True)
+def no_config_cache(monkeypatch):
+    """Don't leave config.yaml.cache behind in the checkout."""
+    monkeypatch.setattr(AnimationLibrary, "cache_config", False)
@@ -1,4 +1,24 @@
-from xwalk2.animation_library import AnimationLibrary
+import json
+import os
+import shutil
+import wave
+from datetime import timedelta
+
+import pytest
+
+from xwalk2.animation_library import (
+    AnimationLibrary,
+    SelectionHistory,
+    build_alias_table,
+)
+
+
+def write_wav(path, seconds):
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(b"\0\0" * int(8000 * seconds))
 
 
 def test_animation_library():
@@ -18,3 +38,172 @@ def test_animation_library():
     # get_active_schedule returns nothing or one of the known menu items.
     active = library.get_active_schedule()
     assert active is None or active in library.config.menu
+
+
+def test_simulate_draws_only_weighted_walks():
+    """Bulk simulation never draws from zero-weight or unknown categories."""
+    library = AnimationLibrary()
+    weights = {"animals": 1, "silly": 0, "not-a-category": 5}
+
+    walks, categories = library.simulate(500, weights)
+
+    assert len(walks) == len(categories) == 500
+    assert set(categories) == {"animals"}
+    assert set(walks) <= set(library.config.walks["animals"])
+
+
+def test_recently_selected_walks_are_not_reselected():
+    """Walks stay out of rotation for walk_cooldown selections."""
+    library = AnimationLibrary()
+    weights = {"animals": 1}
+    cooldown = min(
+        library.config.reselection.walk_cooldown,
+        len(library.config.walks["animals"]),
+    )
+
+    selected = [library.select_walk(weights)[0] for _ in range(cooldown)]
+
+    assert len(set(selected)) == cooldown
+
+
+def test_categories_without_eligible_walks_are_not_drawn():
+    """A category whose walks are all on cooldown is skipped, not drawn."""
+    library = AnimationLibrary()
+    library.walk_history.extend(library.config.walks["political"])
+    weights = {"political": 1000, "animals": 1}
+
+    for _ in range(20):
+        assert library.select_walk(weights)[1] == "animals"
+        # Keep political's walks on cooldown without exhausting animals.
+        library.walk_history.extend(library.config.walks["political"])
+
+
+def test_zero_weight_categories_are_never_drawn():
+    """With only zero-weight categories off cooldown, a walk on cooldown is reused."""
+    library = AnimationLibrary()
+    library.walk_history.extend(library.config.walks["political"])
+    weights = {"political": 1, "silly": 0}
+
+    for _ in range(5):
+        walk, category = library.select_walk(weights)
+        assert category == "political"
+        assert walk in library.config.walks["political"]
+
+
+def test_config_cache_is_invalidated_when_config_changes(tmp_path, monkeypatch):
+    """The pickled config is reused until config.yaml is modified."""
+    monkeypatch.setattr(AnimationLibrary, "cache_config", True)
+    config_path = tmp_path / "config.yaml"
+    shutil.copy("static/data/config.yaml", config_path)
+
+    first = AnimationLibrary(str(config_path)).config
+    # Written via a temporary file, which is gone once the cache is in place.
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "config.yaml",
+        "config.yaml.cache",
+    ]
+    assert AnimationLibrary(str(config_path)).config == first
+
+    config_path.write_text(
+        config_path.read_text().replace("walk_cooldown:", "walk_cooldown: 1 #", 1)
+    )
+    os.utime(config_path, ns=(0, 0))
+    assert AnimationLibrary(str(config_path)).config.reselection.walk_cooldown == 1
+
+
+def test_audio_added_after_first_lookup_is_found(tmp_path):
+    """The audio directory is rescanned when its contents change."""
+    library = AnimationLibrary()
+    library.snd_base_path = tmp_path
+    library._durations_path = tmp_path / ".durations.json"
+
+    with pytest.raises(RuntimeError):
+        library.get_audio_duration("late-arrival")
+
+    write_wav(tmp_path / "late-arrival.wav", seconds=0.5)
+    # Make sure the directory looks modified even on coarse-mtime filesystems.
+    os.utime(tmp_path, ns=(0, 0))
+
+    assert library.get_audio_duration("late-arrival") == pytest.approx(0.5)
+
+
+def test_selection_history_forgets_only_evicted_repeats():
+    """A repeated selection stays in the history until its last copy ages out."""
+    history = SelectionHistory(maxlen=3)
+    history.extend(["a", "b", "a", "c"])
+
+    assert list(history) == ["b", "a", "c"]
+    assert "a" in history
+
+    history.extend(["d", "e"])
+    assert "a" not in history
+    assert len(history) == 3
+
+
+def test_alias_table_matches_weights():
+    """Each index's total probability in the alias table equals its weight share."""
+    weights = [5, 0, 1, 2]
+    prob, alias = build_alias_table(weights)
+
+    n = len(weights)
+    share = [0.0] * n
+    for i in range(n):
+        share[i] += prob[i] / n
+        share[alias[i]] += (1 - prob[i]) / n
+
+    assert share == pytest.approx([w / sum(weights) for w in weights])
+    with pytest.raises(ValueError):
+        build_alias_table([0, 0])
+
+
+def test_active_schedule_follows_menu_boundaries():
+    """The active schedule changes exactly when the next menu item starts."""
+    library = AnimationLibrary()
+    menu = library.config.menu
+    assert len(menu) >= 2, "test needs at least two menu items"
+    one_second = timedelta(seconds=1)
+
+    assert library.get_active_schedule(menu[0].start - one_second) is None
+    assert library.get_active_schedule(menu[0].start) == menu[0]
+    assert library.get_active_schedule(menu[1].start - one_second) == menu[0]
+    assert library.get_active_schedule(menu[1].start) == menu[1]
+    # Going back in time is not answered from the cache.
+    assert library.get_active_schedule(menu[0].start) == menu[0]
+
+    assert (
+        library.get_current_weights(menu[1].start)
+        is library.config.weights[menu[1].weights]
+    )
+
+
+def test_preload_durations_persists_measured_audio(tmp_path):
+    """Preloading measures configured audio and saves it in one write."""
+    library = AnimationLibrary()
+    library.snd_base_path = tmp_path
+    library._durations_path = tmp_path / ".durations.json"
+    library._persisted_durations = {}
+    intro = library.config.intros[0]
+    write_wav(tmp_path / f"{intro}.wav", seconds=0.25)
+
+    library.preload_durations()
+
+    assert library._duration_cache[intro] == pytest.approx(0.25)
+    saved = json.loads(library._durations_path.read_text())
+    assert [key.rsplit(":", 2)[0] for key in saved] == [intro]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_walks_with_custom_intro_use_it():
+    """Walks that name their own intro always play with it."""
+    library = AnimationLibrary()
+    walk, info = next(
+        (name, info)
+        for name, info in library._walk_by_name.items()
+        if info and info.intro
+    )
+    library.get_audio_duration = lambda name: 1.0
+
+    intro, selected, _ = library.select_animation_sequence(walk=walk, verbose=False)
+
+    assert selected.image == walk
+    assert intro.image == info.intro
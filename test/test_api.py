@@ -0,0 +1,295 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+import zmq
+import zmq.asyncio
+from fastapi.testclient import TestClient
+from pydantic_core import to_json
+
+from xwalk2 import api
+from xwalk2.animation_library import AnimationLibrary
+from xwalk2.models import APIResponse, APIStatusRequest, CurrentState, parse_api
+
+
+@pytest.fixture
+def animations():
+    return AnimationLibrary().config
+
+
+def a_status(animations, **changes):
+    fields = dict(
+        message="",
+        success=True,
+        playing=False,
+        components={"timer/crosswalk-a": 1000.0},
+        timestamp=datetime(2025, 6, 1, 12, 0, 0),
+        state="ready",
+        animations=animations,
+    )
+    fields.update(changes)
+    return APIResponse(**fields)
+
+
+def serve_status(monkeypatch, status):
+    async def get_status():
+        return status
+
+    monkeypatch.setattr(api.api_controller, "get_status", get_status)
+
+
+def test_status_etag_ignores_clock_but_not_state(monkeypatch, animations):
+    client = TestClient(api.app)
+    serve_status(monkeypatch, a_status(animations))
+    first = client.get("/status")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+
+    # A later reply: the controller clock and heartbeat times have moved on.
+    serve_status(
+        monkeypatch,
+        a_status(
+            animations,
+            timestamp=datetime(2025, 6, 1, 12, 0, 7),
+            components={"timer/crosswalk-a": 1007.0},
+        ),
+    )
+    unchanged = client.get("/status", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    serve_status(monkeypatch, a_status(animations, walk_queue=["home"]))
+    changed = client.get("/status", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_status_etag_changes_when_a_component_stops_responding(
+    monkeypatch, animations
+):
+    client = TestClient(api.app)
+    serve_status(
+        monkeypatch, a_status(animations, timestamp=datetime.fromtimestamp(1001.0))
+    )
+    fresh = client.get("/status")
+    assert "not responding" not in fresh.text
+
+    serve_status(
+        monkeypatch, a_status(animations, timestamp=datetime.fromtimestamp(1010.0))
+    )
+    stale = client.get("/status", headers={"If-None-Match": fresh.headers["etag"]})
+    assert stale.status_code == 200
+    assert "not responding" in stale.text
+
+
+def test_status_stream_pushes_when_a_component_stops_responding(
+    monkeypatch, animations
+):
+    class StillConnected:
+        async def is_disconnected(self):
+            return False
+
+    statuses = iter(
+        [
+            a_status(animations, timestamp=datetime.fromtimestamp(1001.0)),
+            a_status(animations, timestamp=datetime.fromtimestamp(1002.0)),
+            a_status(animations, timestamp=datetime.fromtimestamp(1010.0)),
+        ]
+    )
+
+    async def get_status():
+        return next(statuses)
+
+    monkeypatch.setattr(api, "api_controller", api.APIController())
+    monkeypatch.setattr(api.api_controller, "get_status", get_status)
+    monkeypatch.setattr(api, "STATUS_STREAM_INTERVAL_S", 0.01)
+
+    async def read_pushes():
+        response = await api.status_stream(StillConnected())
+        events = response.body_iterator
+        try:
+            return [await anext(events), await anext(events)]
+        finally:
+            await events.aclose()
+
+    fresh, stale = asyncio.run(read_pushes())
+
+    assert "not responding" not in fresh
+    assert "not responding" in stale
+
+
+def test_status_is_revalidated_on_every_read(monkeypatch, animations):
+    serve_status(monkeypatch, a_status(animations))
+
+    response = TestClient(api.app).get("/status")
+
+    assert response.headers["cache-control"] == "no-cache"
+
+
+class ControllerStub:
+    """Stands in for the controller's REP socket. A ROUTER sees each
+    request with its envelope, so replies can be sent in any order."""
+
+    def __init__(self, monkeypatch, address="inproc://test-controller"):
+        self.socket = zmq.asyncio.Context.instance().socket(zmq.ROUTER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.bind(address)
+        monkeypatch.setattr(api, "CONTROLLER_ADDRESS", address)
+
+    async def receive(self):
+        """The next request: (envelope, parsed request)."""
+        *envelope, payload = await asyncio.wait_for(
+            self.socket.recv_multipart(), 1.0
+        )
+        return envelope, parse_api(payload)
+
+    async def reply(self, envelope, response):
+        payload = response.model_dump_json().encode()
+        await self.socket.send_multipart([*envelope, payload])
+
+    async def idle(self):
+        """Whether no further request arrives."""
+        return not await self.socket.poll(100)
+
+    def close(self):
+        self.socket.close()
+
+
+def with_controller(monkeypatch, test):
+    """Run test(controller, stub) against a fresh APIController."""
+
+    async def run():
+        stub = ControllerStub(monkeypatch)
+        controller = api.APIController()
+        controller.start()
+        try:
+            await test(controller, stub)
+        finally:
+            controller.stop()
+            stub.close()
+
+    asyncio.run(run())
+
+
+def test_replies_reach_their_own_caller(monkeypatch, animations):
+    async def test(controller, stub):
+        first = asyncio.ensure_future(controller.queue_walk("home"))
+        second = asyncio.ensure_future(controller.queue_walk("wave"))
+        first_envelope, first_request = await stub.receive()
+        second_envelope, second_request = await stub.receive()
+        assert (first_request.walk, second_request.walk) == ("home", "wave")
+
+        # Answer out of order.
+        await stub.reply(second_envelope, a_status(animations, message="wave"))
+        await stub.reply(first_envelope, a_status(animations, message="home"))
+
+        assert (await first).message == "home"
+        assert (await second).message == "wave"
+
+    with_controller(monkeypatch, test)
+
+
+def test_concurrent_status_reads_share_one_request(monkeypatch, animations):
+    async def test(controller, stub):
+        readers = [asyncio.ensure_future(controller.get_status()) for _ in range(3)]
+        envelope, request = await stub.receive()
+        assert isinstance(request, APIStatusRequest)
+        assert await stub.idle()
+
+        await stub.reply(envelope, a_status(animations))
+        statuses = await asyncio.gather(*readers)
+
+        assert statuses[0].state == "ready"
+        assert all(status is statuses[0] for status in statuses)
+        # Fresh enough to reuse without asking again.
+        assert await controller.get_status() is statuses[0]
+        assert await stub.idle()
+
+    with_controller(monkeypatch, test)
+
+
+def test_state_change_during_status_read_is_not_cached(monkeypatch, animations):
+    async def test(controller, stub):
+        reader = asyncio.ensure_future(controller.get_status())
+        status_envelope, _ = await stub.receive()
+        press = asyncio.ensure_future(controller.press_button())
+        press_envelope, _ = await stub.receive()
+
+        await stub.reply(status_envelope, a_status(animations))
+        await stub.reply(press_envelope, a_status(animations, state="walk"))
+        assert (await reader).state == "ready"
+        await press
+
+        # The status read predates the press, so it must not be served again.
+        rereader = asyncio.ensure_future(controller.get_status())
+        envelope, _ = await stub.receive()
+        await stub.reply(envelope, a_status(animations, state="walk"))
+        assert (await rereader).state == "walk"
+
+    with_controller(monkeypatch, test)
+
+
+def test_request_after_timeout_gets_its_own_reply(monkeypatch, animations):
+    async def test(controller, stub):
+        controller._timeout_s = 0.1
+        with pytest.raises(TimeoutError):
+            await controller.press_button()
+        late_envelope, _ = await stub.receive()
+
+        controller._timeout_s = 1.0
+        queued = asyncio.ensure_future(controller.queue_walk("home"))
+        envelope, request = await stub.receive()
+        assert request.walk == "home"
+
+        # The reply to the timed-out press arrives first and is dropped.
+        await stub.reply(late_envelope, a_status(animations, message="late"))
+        await stub.reply(envelope, a_status(animations, message="queued"))
+        assert (await queued).message == "queued"
+        assert controller._pending == {}
+
+    with_controller(monkeypatch, test)
+
+
+def test_status_streams_share_one_read_per_change(monkeypatch, animations):
+    class StillConnected:
+        async def is_disconnected(self):
+            return False
+
+    monkeypatch.setattr(api, "CONTROL_ADDRESS", "inproc://test-control")
+    monkeypatch.setattr(api, "STATUS_STREAM_INTERVAL_S", 60.0)
+
+    async def test(controller, stub):
+        control = zmq.asyncio.Context.instance().socket(zmq.PUB)
+        control.setsockopt(zmq.LINGER, 0)
+        control.bind(api.CONTROL_ADDRESS)
+        monkeypatch.setattr(api, "api_controller", controller)
+        controller.watch_status_changes()
+        streams = [
+            (await api.status_stream(StillConnected())).body_iterator
+            for _ in range(3)
+        ]
+        pushes = []
+        try:
+            pushes = [asyncio.ensure_future(anext(events)) for events in streams]
+            envelope, _ = await stub.receive()
+            assert await stub.idle()
+            await stub.reply(envelope, a_status(animations))
+            await asyncio.gather(*pushes)
+
+            # Give the watcher's subscription time to reach the publisher.
+            await asyncio.sleep(0.1)
+            pushes = [asyncio.ensure_future(anext(events)) for events in streams]
+            for _ in range(3):
+                await control.send(to_json(CurrentState(state="walk")))
+            envelope, _ = await stub.receive()
+            assert await stub.idle()
+            await stub.reply(envelope, a_status(animations, message="Changed"))
+            assert all("Changed" in push for push in await asyncio.gather(*pushes))
+        finally:
+            for push in pushes:
+                push.cancel()
+            await asyncio.gather(*pushes, return_exceptions=True)
+            for events in streams:
+                await events.aclose()
+            control.close()
+
+    with_controller(monkeypatch, test)
@@ -19,7 +19,7 @@ def test_light_starts_off():
 
 def test_play_scene_turns_light_off():
     light = make_light()
-    light.led.on()
+    light.process_message(EndScene())
 
     light.process_message(
         PlayScene(
@@ -44,7 +44,7 @@ def test_end_scene_turns_light_on():
 
 def test_current_state_walk_turns_light_off():
     light = make_light()
-    light.led.on()
+    light.process_message(EndScene())
 
     light.process_message(CurrentState(state="walk"))
 
@@ -57,3 +57,15 @@ def test_current_state_ready_turns_light_on():
     light.process_message(CurrentState(state="ready"))
 
     assert light.led.light == "on"
+
+
+def test_repeated_state_does_not_rewrite_light():
+    light = make_light()
+    light.process_message(CurrentState(state="ready"))
+    writes = []
+    light.led.on = lambda: writes.append("on")
+
+    light.process_message(CurrentState(state="ready"))
+    light.process_message(EndScene())
+
+    assert writes == []
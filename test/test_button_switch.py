@@ -71,3 +71,13 @@ def test_press_duration_reflects_how_long_the_button_was_held(monkeypatch):
     # Allow generous slack for scheduling jitter; this just guards against
     # e.g. duration being computed in the wrong units or not at all.
     assert 150 <= sent[0].press_duration <= 500
+
+
+def test_button_pins_itself_to_configured_cpu(monkeypatch):
+    pinned = []
+    monkeypatch.setattr("os.sched_setaffinity", lambda pid, cpus: pinned.append(cpus))
+    monkeypatch.setenv("XWALK_BUTTON_CPU", "3")
+
+    make_button(monkeypatch)
+
+    assert pinned == [{3}]
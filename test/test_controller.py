@@ -0,0 +1,28 @@
+import json
+from datetime import datetime
+
+from xwalk2.animation_library import AnimationLibrary
+from xwalk2.controller import encode_animations, encode_response
+from xwalk2.models import APIResponse
+
+
+def test_encode_response_matches_model_dump_json():
+    library = AnimationLibrary()
+    response = APIResponse(
+        success=True,
+        message="Walk 'home' queued. 1 total queued.",
+        playing=True,
+        components={"timer/crosswalk-a": 1000.0},
+        timestamp=datetime(2025, 6, 1, 12, 0, 0),
+        state="walk",
+        animations=library.config,
+        walk_queue=["home"],
+        walk_history=[(datetime(2025, 6, 1, 11, 59, 0), "wave")],
+        active_schedule=library.get_active_schedule(),
+        menu=library.config.menu,
+    )
+
+    encoded = encode_response(response, encode_animations(library.config))
+
+    assert json.loads(encoded) == json.loads(response.model_dump_json())
+    assert APIResponse.model_validate_json(encoded) == response
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from xwalk2.models import (
+    APIQueueWalk,
+    CurrentState,
+    EndScene,
+    Heartbeat,
+    PlayScene,
+    ResetCommand,
+    SysCommand,
+    WalkDefinition,
+    parse_api,
+    parse_message,
+    topic,
+)
+
+
+def a_walk_definition():
+    return WalkDefinition(image="walk", audio="walk", duration=1.0)
+
+
+def test_serialized_messages_start_with_their_topic():
+    """Subscribers filter on this prefix, so `type` must serialize first."""
+    messages = [
+        PlayScene(
+            intro=a_walk_definition(),
+            walk=a_walk_definition(),
+            outro=a_walk_definition(),
+            stop=a_walk_definition(),
+            total_duration=3.0,
+        ),
+        EndScene(),
+        CurrentState(state="ready"),
+        ResetCommand(),
+        SysCommand(action="reboot"),
+    ]
+
+    for message in messages:
+        assert message.model_dump_json().startswith(topic(message.type))
+
+
+def test_parse_message_round_trips():
+    message = CurrentState(state="walk")
+
+    assert parse_message(message.model_dump_json()) == message
+
+
+def test_parse_api_picks_model_by_type():
+    request = APIQueueWalk(walk="home")
+
+    assert parse_api(request.model_dump_json().encode()) == request
+    assert parse_api(SysCommand(action="reboot").model_dump_json()).action == "reboot"
+    with pytest.raises(ValueError):
+        parse_api(b'{"type": "not-a-request"}')
+
+
+def test_heartbeat_accepts_epoch_or_legacy_datetime_sent_at():
+    sent = datetime(2025, 6, 1, 12, 0, 0)
+    legacy = (
+        '{"type":"heartbeat","host":"h","component":"c",'
+        f'"sent_at":"{sent.isoformat()}","initial":false}}'
+    )
+
+    assert Heartbeat.model_validate_json(legacy).sent_at == sent.timestamp()
+    beat = Heartbeat(host="h", component="c", sent_at=1.5, initial=True)
+    assert Heartbeat.model_validate_json(beat.model_dump_json()).sent_at == 1.5
+
+
+def test_button_press_accepts_legacy_datetime_sent_at():
+    sent = datetime(2025, 6, 1, 12, 0, 0)
+    legacy = (
+        '{"type":"button_press","host":"h","component":"c",'
+        f'"press_duration":120,"sent_at":"{sent.isoformat()}"}}'
+    )
+
+    press = parse_message(legacy)
+
+    assert press.sent_at_ns == int(sent.timestamp()) * 1_000_000_000
+    assert "sent_at" not in press.model_dump()
+
+
+def test_button_press_accepts_epoch_sent_at_and_rejects_others():
+    legacy = (
+        '{"type":"button_press","host":"h","component":"c",'
+        '"press_duration":120,"sent_at":%s}'
+    )
+
+    assert parse_message(legacy % "1.5").sent_at_ns == 1_500_000_000
+    with pytest.raises(ValidationError):
+        parse_message(legacy % "null")
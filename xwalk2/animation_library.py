@@ -1,23 +1,141 @@
+import bisect
+import json
 import logging
+import os
+import pickle
 import random
-import wave
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pydantic
+
+from xwalk2 import models
+from xwalk2.models import (
+    Animations,
+    MenuItem,
+    WalkDefinition,
+    WalkInfo,
+    WeightSchedule,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
-import mutagen
-import numpy as np
-import yaml
+logger = logging.getLogger(__name__)
+
+# Audio file extensions, in order of preference
+AUDIO_EXTENSIONS = (".mp3", ".m4a", ".wav")
+
+
+def build_alias_table(weights: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """
+    Build a Walker alias table (Vose's method) for O(1) weighted draws.
+
+    To draw, pick a uniform index i, then keep i with probability prob[i]
+    and take alias[i] otherwise.
+    """
+    n = len(weights)
+    total = sum(weights)
+    if not n or total <= 0:
+        raise ValueError("Total of weights must be greater than zero")
+
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Anything left over is 1.0 up to rounding error.
+    return prob, alias
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Replace path with data, never leaving a partly written file in its place.
+
+    The temporary file is unique, so processes saving the same file at once
+    (e.g. the controller and bin/simulate_schedule.py) don't truncate each
+    other's copy.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
-from xwalk2.models import Animations, WeightSchedule, MenuItem, WalkDefinition
 
-logger = logging.getLogger(__name__)
+class SelectionHistory:
+    """The last maxlen selections, with constant-time membership checks"""
+
+    def __init__(self, maxlen: int):
+        self._items: deque[str] = deque(maxlen=maxlen)
+        # Selections can repeat within the window, so count them rather than
+        # keeping a plain set.
+        self._counts: Counter[str] = Counter()
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._items.maxlen
+
+    def append(self, item: str) -> None:
+        if self._items.maxlen == 0:
+            return
+        if len(self._items) == self._items.maxlen:
+            oldest = self._items[0]
+            self._counts[oldest] -= 1
+            if not self._counts[oldest]:
+                del self._counts[oldest]
+        self._items.append(item)
+        self._counts[item] += 1
+
+    def extend(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._counts
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
 
 
 class AnimationLibrary:
     """Manages animation selection based on weighted schedules from config.yaml"""
 
+    # Whether to keep a pickled copy of the parsed config next to config.yaml.
+    # Tests turn this off so they don't write into the checkout.
+    cache_config = True
+
     def __init__(self, config_path: str = "static/data/config.yaml"):
         """Initialize library by loading config file"""
         self.config_path = Path(config_path)
@@ -30,39 +148,176 @@ class AnimationLibrary:
 
         # Cache for audio durations
         self._duration_cache: Dict[str, float] = {}
-        self.walk_history: deque[str] = deque(
-            maxlen=self.config.reselection.walk_cooldown
+        # Durations persisted across processes, keyed by
+        # "<filename>:<mtime_ns>:<size>" so replacing an audio file invalidates
+        # its entry even if the copy preserved the mtime.
+        self._durations_path = self.snd_base_path / ".durations.json"
+        self._persisted_durations: Dict[str, float] = self._load_durations()
+        # Guards _persisted_durations and its file while preload_durations()
+        # measures files from worker threads.
+        self._durations_lock = threading.Lock()
+        self._durations_dirty = False
+        # Audio file name (without extension) -> extensions present, filled by
+        # scanning snd_base_path on the first lookup that misses.
+        self._audio_exts: Dict[str, List[str]] = {}
+        self._audio_dir_mtime: Optional[int] = None
+        self.walk_history = SelectionHistory(self.config.reselection.walk_cooldown)
+        self.category_history = SelectionHistory(
+            self.config.reselection.category_cooldown
         )
-        self.category_history: deque[str] = deque(
-            maxlen=self.config.reselection.category_cooldown
+        self._cooldown_categories = frozenset(
+            self.config.reselection.cooldown_categories
         )
 
+        # Walk names per category, built once. "_" is the wildcard category
+        # (e.g. the default weights) and maps to every walk in every category.
+        self._walks_by_category: Dict[str, Tuple[str, ...]] = {
+            category: tuple(walks.keys())
+            for category, walks in self.config.walks.items()
+        }
+        self._all_walk_names: Tuple[str, ...] = tuple(
+            name for walks in self._walks_by_category.values() for name in walks
+        )
+        self._walks_by_category["_"] = self._all_walk_names
+        # Flat walk name -> info, matching config.get_walk(): the first
+        # category that lists a walk wins, and bare entries map to None.
+        self._walk_by_name: Dict[str, Optional[WalkInfo]] = {}
+        for walks in self.config.walks.values():
+            for name, info in walks.items():
+                self._walk_by_name.setdefault(name, info)
+        # Walks with their own intro/outro, such as the language walks
+        self._walk_to_intro: Dict[str, str] = {
+            name: info.intro
+            for name, info in self._walk_by_name.items()
+            if info and info.intro
+        }
+        self._walk_to_outro: Dict[str, str] = {
+            name: info.outro
+            for name, info in self._walk_by_name.items()
+            if info and info.outro
+        }
+        self._intros: Tuple[str, ...] = tuple(self.config.intros)
+        self._outros: Tuple[str, ...] = tuple(self.config.outros)
+
+        # The Animations validator keeps the menu sorted by start time, so the
+        # active schedule can be found by bisecting the start times.
+        self._schedule_starts: List[datetime] = [
+            item.start for item in self.config.menu
+        ]
+        # (valid from, valid until, active schedule) for the last lookup.
+        self._schedule_cache: Optional[
+            Tuple[datetime, Optional[datetime], Optional[MenuItem]]
+        ] = None
+
+        # numpy Generator for simulate(), created on first use so numpy is
+        # only imported when simulating.
+        self._rng: Optional["np.random.Generator"] = None
+
+        # (id(weights), eligible categories) -> (weights, alias table).
+        # Only a handful of combinations occur, since the schedule changes
+        # rarely and the category cooldown history is short.
+        self._alias_cache: Dict[
+            Tuple[int, Tuple[str, ...]],
+            Tuple[WeightSchedule, Tuple[List[float], List[int]]],
+        ] = {}
+
     def _load_config(self) -> Animations:
-        """Load and parse the config.yaml file"""
+        """Load and parse the config.yaml file, reusing the pickled copy if current"""
+        cache_path = self.config_path.with_name(self.config_path.name + ".cache")
         try:
-            with open(self.config_path, "r") as f:
-                return Animations(**yaml.safe_load(f))
-        except Exception as e:
+            # The cache is only valid for this exact config file and the
+            # models it was validated against, under the same pydantic.
+            config_stat = self.config_path.stat()
+            models_stat = Path(models.__file__).stat()
+        except OSError as e:
             raise RuntimeError(f"Failed to load config from {self.config_path}: {e}")
+        cache_key = (
+            config_stat.st_mtime_ns,
+            config_stat.st_size,
+            models_stat.st_mtime_ns,
+            models_stat.st_size,
+            pydantic.VERSION,
+        )
 
-    def get_active_schedule(self) -> Optional[MenuItem]:
-        now = datetime.now()
+        if self.cache_config:
+            try:
+                with open(cache_path, "rb") as f:
+                    cached_key, config = pickle.load(f)
+                if cached_key == cache_key and isinstance(config, Animations):
+                    return config
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable {cache_path}: {e}")
+
+        try:
+            import yaml
 
-        active_schedule = None
-        latest_start_time = None
+            with open(self.config_path, "r") as f:
+                # The libyaml-backed loader is much faster when PyYAML was
+                # built with it; fall back to the pure-Python one otherwise.
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                config = Animations(**yaml.load(f, Loader=loader))
+        except Exception as e:
+            raise RuntimeError(f"Failed to load config from {self.config_path}: {e}")
 
-        for schedule in self.config.menu:
-            if schedule.start <= now:
-                if latest_start_time is None or schedule.start > latest_start_time:
-                    latest_start_time = schedule.start
-                    active_schedule = schedule
+        if not self.cache_config:
+            return config
+        try:
+            _write_atomically(
+                cache_path,
+                pickle.dumps((cache_key, config), protocol=pickle.HIGHEST_PROTOCOL),
+            )
+        except OSError as e:
+            logger.warning(f"Could not save {cache_path}: {e}")
+        return config
 
-        return active_schedule
+    def _load_durations(self) -> Dict[str, float]:
+        """Load audio durations saved by a previous process, if any"""
+        try:
+            return json.loads(self._durations_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable {self._durations_path}: {e}")
+            return {}
+
+    def _save_durations(self) -> None:
+        """Atomically write the persisted audio durations (hold _durations_lock)"""
+        try:
+            _write_atomically(
+                self._durations_path,
+                json.dumps(self._persisted_durations).encode(),
+            )
+            self._durations_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save {self._durations_path}: {e}")
+
+    def get_active_schedule(self, now: Optional[datetime] = None) -> Optional[MenuItem]:
+        """The latest menu item that has already started as of now, if any"""
+        if now is None:
+            now = datetime.now()
+        if self._schedule_cache:
+            valid_from, valid_until, active = self._schedule_cache
+            if valid_from <= now and (valid_until is None or now < valid_until):
+                return active
+
+        idx = bisect.bisect_right(self._schedule_starts, now) - 1
+        active = self.config.menu[idx] if idx >= 0 else None
+        # The answer holds until the next menu item starts.
+        valid_from = self._schedule_starts[idx] if idx >= 0 else datetime.min
+        next_idx = idx + 1
+        valid_until = (
+            self._schedule_starts[next_idx]
+            if next_idx < len(self._schedule_starts)
+            else None
+        )
+        self._schedule_cache = (valid_from, valid_until, active)
+        return active
 
-    def get_current_weights(self) -> WeightSchedule:
+    def get_current_weights(self, now: Optional[datetime] = None) -> WeightSchedule:
         """Determine which weight set to use based on the current time and schedule."""
-
-        active_schedule = self.get_active_schedule()
+        active_schedule = self.get_active_schedule(now)
 
         weights = self.config.weights["default"]
 
@@ -79,27 +334,86 @@ class AnimationLibrary:
         Select a random* intro animation with even distribution
         """
         # Random selection with even distribution
-        return str(np.random.choice(self.config.intros))
+        return random.choice(self._intros)
+
+    def _get_eligible_items(
+        self,
+        items: Sequence[str],
+        history: SelectionHistory,
+        is_exempt: Callable[[str], bool],
+    ) -> List[str]:
+        """Items not selected recently, or exempt from the reselection cooldown"""
+        return [item for item in items if item not in history or is_exempt(item)]
+
+    def _get_eligible_categories(self, categories: List[str]) -> List[str]:
+        """Categories that are not in cooldown"""
+        return self._get_eligible_items(
+            categories,
+            self.category_history,
+            lambda category: category not in self._cooldown_categories,
+        )
+
+    def _get_eligible_walks(self, walks: Sequence[str]) -> List[str]:
+        """Walks that are not in cooldown"""
+        return self._get_eligible_items(
+            walks, self.walk_history, self._ignores_reselection
+        )
 
-    def select_walk(self, weights: Optional[WeightSchedule] = None) -> Tuple[str, str]:
+    def _ignores_reselection(self, walk: str) -> bool:
+        walk_info = self._walk_by_name.get(walk)
+        return bool(walk_info and walk_info.ignore_reselection)
+
+    def _category_alias_table(
+        self, categories: Tuple[str, ...], weights: WeightSchedule
+    ) -> Tuple[List[float], List[int]]:
+        """Walker alias table for drawing from categories, cached per schedule"""
+        key = (id(weights), categories)
+        cached = self._alias_cache.get(key)
+        # Holding a reference to the schedule keeps its id from being reused.
+        if cached is not None and cached[0] is weights:
+            return cached[1]
+
+        table = build_alias_table([weights[c] for c in categories])
+        if len(self._alias_cache) >= 64:
+            self._alias_cache.clear()
+        self._alias_cache[key] = (weights, table)
+        return table
+
+    def _select_weighted_category(
+        self, categories: List[str], weights: WeightSchedule
+    ) -> str:
+        """Draw one category, proportional to its (unnormalized) weight"""
+        prob, alias = self._category_alias_table(tuple(categories), weights)
+        i = random.randrange(len(categories))
+        return categories[i] if random.random() < prob[i] else categories[alias[i]]
+
+    def select_walk(
+        self,
+        weights: Optional[WeightSchedule] = None,
+        now: Optional[datetime] = None,
+    ) -> Tuple[str, str]:
         """Select a random walk animation based on current weights"""
         # Extract walk names and their weights based on categories
         if not weights:
-            weights = self.get_current_weights()
-        categories = list(weights.keys())
-        walk_names: list[str] = []
-
-        valid_categories = []
-        for cat in categories:
-            if cat in self.config.reselection.cooldown_categories:
-                # Skip categories in cooldown
-                if cat in self.category_history:
-                    continue
-                else:
-                    valid_categories.append(cat)
-            else:
-                # Add to valid categories if not in cooldown
-                valid_categories.append(cat)
+            weights = self.get_current_weights(now)
+        # Ignore weighted categories that have no walks configured.
+        categories = [c for c in weights.keys() if c in self._walks_by_category]
+
+        # Only draw from categories that still have a walk off cooldown, so
+        # the weighted draw can't land on a category it would have to
+        # fall back out of. Zero-weight categories can never be drawn.
+        eligible_walks = {
+            c: self._get_eligible_walks(self._walks_by_category[c])
+            for c in categories
+        }
+        eligible_categories = [
+            c for c in self._get_eligible_categories(categories) if weights[c] > 0
+        ]
+        valid_categories = [c for c in eligible_categories if eligible_walks[c]]
+        if not valid_categories:
+            # Every weighted category has all of its walks on cooldown: draw
+            # as usual and reuse a walk from the drawn category below.
+            valid_categories = eligible_categories
 
         if not valid_categories:
             logger.error(
@@ -108,27 +422,10 @@ class AnimationLibrary:
             )
             valid_categories = categories
 
-        valid_weights = [weights[cat] for cat in valid_categories]
-
-        cat_weights = np.array(valid_weights, dtype=np.float32)
-        cat_weights /= cat_weights.sum()  # Normalize weights
-        category = str(np.random.choice(valid_categories, p=cat_weights))
-        # "_" is the wildcard category (e.g. the default weights): pick from
-        # every walk in every category.
-        if category == "_":
-            for walks in self.config.walks.values():
-                walk_names.extend(walks.keys())
-        else:
-            walk_names = list(self.config.walks[category].keys())
-
-        valid_walks = []
-        for walk in walk_names:
-            if walk in self.walk_history:
-                walk_info = self.config.get_walk(walk)
-                if walk_info and walk_info.ignore_reselection:
-                    valid_walks.append(walk)
-            else:
-                valid_walks.append(walk)
+        category = self._select_weighted_category(valid_categories, weights)
+        walk_names = self._walks_by_category[category]
+
+        valid_walks = eligible_walks[category]
 
         logger.info(
             f"Selected walk category: {category}, found {len(walk_names)} walks, {len(valid_walks)} valid walks"
@@ -146,14 +443,81 @@ class AnimationLibrary:
         self.category_history.append(category)
         return selected_walk, category
 
+    def simulate(
+        self, n: int, weights: WeightSchedule
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Draw n independent walks from a weight schedule in bulk.
+
+        Unlike repeated select_walk calls this ignores reselection cooldowns
+        (and does not touch the walk/category history), so it shows the raw
+        distribution a weight schedule produces. Returns (walks, categories).
+        """
+        # numpy is only needed for bulk simulation, so keep it off the
+        # controller's import path.
+        import numpy as np
+
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        rng = self._rng
+        categories = [c for c in weights.keys() if c in self._walks_by_category]
+        probs = np.array([weights[c] for c in categories], dtype=np.float64)
+        probs /= probs.sum()
+
+        category_idx = rng.choice(len(categories), size=n, p=probs)
+        walks = np.empty(n, dtype=object)
+        for i, category in enumerate(categories):
+            mask = category_idx == i
+            names = np.array(self._walks_by_category[category], dtype=object)
+            walks[mask] = names[rng.integers(len(names), size=mask.sum())]
+
+        return walks.astype(str), np.array(categories)[category_idx]
+
     def select_outro(self) -> str:
         """Select a random outro animation with even distribution"""
 
-        if not self.config.outros:
+        if not self._outros:
             raise RuntimeError("No outro animations available")
 
         # Random selection with even distribution
-        return str(np.random.choice(self.config.outros))
+        return random.choice(self._outros)
+
+    def _scan_audio_dir(self) -> None:
+        """Map each audio file name (without extension) to its extensions"""
+        audio_exts: Dict[str, List[str]] = {}
+        try:
+            self._audio_dir_mtime = self.snd_base_path.stat().st_mtime_ns
+            with os.scandir(self.snd_base_path) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext in AUDIO_EXTENSIONS and entry.is_file():
+                        audio_exts.setdefault(stem, []).append(ext)
+        except FileNotFoundError:
+            self._audio_dir_mtime = None
+        for exts in audio_exts.values():
+            exts.sort(key=AUDIO_EXTENSIONS.index)
+        self._audio_exts = audio_exts
+
+    def _audio_extensions(self, filename: str) -> List[str]:
+        """Extensions available for an audio file, in order of preference"""
+        exts = self._audio_exts.get(filename)
+        if exts is None:
+            # Rescan only if files were added or removed since the last scan.
+            try:
+                dir_mtime = self.snd_base_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                dir_mtime = None
+            if dir_mtime != self._audio_dir_mtime:
+                self._scan_audio_dir()
+                exts = self._audio_exts.get(filename)
+        return exts or []
+
+    def _audio_filename(self, animation_name: str) -> str:
+        """The walk's custom audio name if it has one, else the animation name"""
+        walk_info = self._walk_by_name.get(animation_name)
+        if walk_info and walk_info.audio:
+            return walk_info.audio
+        return animation_name
 
     def get_audio_duration(self, animation_name: str) -> float:
         """
@@ -161,44 +525,102 @@ class AnimationLibrary:
         If the animation has a custom audio name, use it.
         Otherwise, use the animation name itself as the filename.
         """
-        # Check if the animation is a walk and has a custom audio file
-        walk_info = self.config.get_walk(animation_name)
+        return self._file_duration(self._audio_filename(animation_name))
 
-        if walk_info and walk_info.audio:
-            filename = walk_info.audio
-        else:
-            filename = animation_name
+    def preload_durations(self, max_workers: int = 8) -> None:
+        """
+        Measure the audio for every configured animation up front.
 
+        Files are read in parallel so their I/O overlaps; once the durations
+        are persisted this only stats each file.
+        """
+        names = {
+            *self._intros,
+            *self._outros,
+            *self._all_walk_names,
+            *self._walk_to_intro.values(),
+            *self._walk_to_outro.values(),
+        }
+        filenames = {self._audio_filename(name) for name in names}
+        filenames.difference_update(self._duration_cache)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                filename: pool.submit(self._file_duration, filename, save=False)
+                for filename in filenames
+            }
+        for filename, future in futures.items():
+            try:
+                future.result()
+            except RuntimeError as e:
+                logger.warning(str(e))
+
+        with self._durations_lock:
+            if self._durations_dirty:
+                self._save_durations()
+
+    def _file_duration(self, filename: str, save: bool = True) -> float:
+        """Duration of the named audio file, measuring it if not cached"""
         if filename in self._duration_cache:
             return self._duration_cache[filename]
 
-        # Try different audio file extensions
-        for ext in [".mp3", ".m4a", ".wav"]:
+        # Try the audio file extensions that exist for this name
+        for ext in self._audio_extensions(filename):
             audio_path = self.snd_base_path / f"{filename}{ext}"
-            if audio_path.exists():
-                try:
-                    # Use mutagen for most audio formats
-                    audio_file = mutagen.File(str(audio_path))
-                    if audio_file is not None and hasattr(audio_file, "info"):
-                        duration = audio_file.info.length
-                    elif ext == ".wav":
-                        # Fallback to wave module for WAV files
+            try:
+                stat = audio_path.stat()
+            except FileNotFoundError:
+                continue
+            key = f"{filename}:{stat.st_mtime_ns}:{stat.st_size}"
+            if key in self._persisted_durations:
+                duration = self._persisted_durations[key]
+                self._duration_cache[filename] = duration
+                return duration
+            try:
+                duration = None
+                if ext == ".wav":
+                    import wave
+
+                    # The RIFF header has everything needed; no need for
+                    # mutagen's format sniffing.
+                    try:
                         with wave.open(str(audio_path), "rb") as wav_file:
                             frames = wav_file.getnframes()
                             rate = wav_file.getframerate()
                             duration = frames / float(rate)
-                    else:
-                        continue  # Try next extension
+                    except wave.Error:
+                        pass  # e.g. non-PCM WAV; let mutagen try
 
-                    self._duration_cache[filename] = duration
-                    return duration
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not read {audio_path.name}: {e}")
-                    continue
+                if duration is None:
+                    import mutagen
+
+                    # Use mutagen for most audio formats
+                    audio_file = mutagen.File(str(audio_path))
+                    if audio_file is None or not hasattr(audio_file, "info"):
+                        continue  # Try next extension
+                    duration = audio_file.info.length
+
+                self._duration_cache[filename] = duration
+                with self._durations_lock:
+                    # Drop entries for older versions of this file.
+                    for stale in [
+                        k for k in self._persisted_durations
+                        if k.rsplit(":", 2)[0] == filename
+                    ]:
+                        del self._persisted_durations[stale]
+                    self._persisted_durations[key] = duration
+                    if save:
+                        self._save_durations()
+                    else:
+                        self._durations_dirty = True
+                return duration
+            except Exception as e:
+                print(f"⚠️  Warning: Could not read {audio_path.name}: {e}")
+                continue
 
         # Raise error if no audio file found since all animations should have audio
         raise RuntimeError(
-            f"❌ No audio file found for '{filename}' in {self.snd_base_path}. Expected extensions: .mp3, .m4a, .wav"
+            f"❌ No audio file found for '{filename}' in {self.snd_base_path}. Expected extensions: {', '.join(AUDIO_EXTENSIONS)}"
         )
 
     def get_sequence_durations(
@@ -212,7 +634,11 @@ class AnimationLibrary:
         return intro_duration, walk_duration, outro_duration
 
     def select_animation_sequence(
-        self, walk: Optional[str] = None, weights: Optional[WeightSchedule] = None, verbose=True
+        self,
+        walk: Optional[str] = None,
+        weights: Optional[WeightSchedule] = None,
+        verbose=True,
+        now: Optional[datetime] = None,
     ) -> Tuple[WalkDefinition, WalkDefinition, WalkDefinition]:
         """
         Select a complete animation sequence: intro, walk, outro
@@ -222,59 +648,58 @@ class AnimationLibrary:
         """
         category = None
         if not walk:
-            walk, category = self.select_walk(weights=weights)
+            walk, category = self.select_walk(weights=weights, now=now)
        
-        # choose default intro and outro
-        intro = self.select_intro()
-        outro = self.select_outro()
-
-        # Check whether we should be using a custom intro and outro
-        # and update if so
-        walk_info = self.config.get_walk(walk)
-        if walk_info:
-            intro = walk_info.intro or self.select_intro()
-            outro = walk_info.outro or self.select_outro()
-            audio_walk = walk_info.audio or walk
-        else:
-            audio_walk = walk
+        # Use the walk's custom intro and outro (e.g. language-specific
+        # ones) if it has them, otherwise choose the defaults
+        intro = self._walk_to_intro.get(walk) or self.select_intro()
+        outro = self._walk_to_outro.get(walk) or self.select_outro()
+        audio_walk = self._audio_filename(walk)
 
         logger.info(f"selected {intro=} {walk=} {outro=}")
 
         audio_intro = intro
         audio_outro = outro
 
-        # Get durations for logging
+        # Durations set the scene length (and the scene timer), so they are
+        # always needed, not just for the table below.
         intro_duration, walk_duration, outro_duration = self.get_sequence_durations(
             audio_intro, audio_walk, audio_outro
         )
         total_duration = intro_duration + walk_duration + outro_duration
 
-        if verbose:
-            # Log sequence selection in table format
-            print(f"\nAnimation sequence selected:")
-            print(f"┌─────────────┬──────────────────────┬──────────────┐")
-            print(f"│ Phase       │ Animation            │ Duration     │")
-            print(f"├─────────────┼──────────────────────┼──────────────┤")
-            print(f"│ Intro       │ {intro:<20} │ {intro_duration:>7.2f}s     │")
-            print(f"│ Walk        │ {walk:<20} │ {walk_duration:>7.2f}s     │")
-            print(f"│ Outro       │ {outro:<20} │ {outro_duration:>7.2f}s     │")
-            print(f"├─────────────┴──────────────────────┼──────────────┤")
-            print(f"│ Total                              │ {total_duration:>7.2f}s     │")
-            print(f"└────────────────────────────────────┴──────────────┘")
-
-        if any(
-            duration is None
-            for duration in [intro_duration, walk_duration, outro_duration]
-        ):
-            print(f"⚠️  Some animations missing audio files")
-
-        wintro = WalkDefinition(image=intro, audio=audio_intro, duration=intro_duration)
-
-        wwalk = WalkDefinition(
+        if verbose and logger.isEnabledFor(logging.INFO):
+            # Log sequence selection in table format, as a single record
+            logger.info(
+                "\n".join(
+                    [
+                        "Animation sequence selected:",
+                        "┌─────────────┬──────────────────────┬──────────────┐",
+                        "│ Phase       │ Animation            │ Duration     │",
+                        "├─────────────┼──────────────────────┼──────────────┤",
+                        f"│ Intro       │ {intro:<20} │ {intro_duration:>7.2f}s     │",
+                        f"│ Walk        │ {walk:<20} │ {walk_duration:>7.2f}s     │",
+                        f"│ Outro       │ {outro:<20} │ {outro_duration:>7.2f}s     │",
+                        "├─────────────┴──────────────────────┼──────────────┤",
+                        f"│ Total                              │ {total_duration:>7.2f}s     │",
+                        "└────────────────────────────────────┴──────────────┘",
+                    ]
+                )
+            )
+
+        # Names come from the already-validated config and durations from the
+        # audio files, so skip re-validating them.
+        wintro = WalkDefinition.model_construct(
+            image=intro, audio=audio_intro, duration=intro_duration
+        )
+
+        wwalk = WalkDefinition.model_construct(
             image=walk, audio=audio_walk, duration=walk_duration, category=category
         )
 
-        woutro = WalkDefinition(image=outro, audio=audio_outro, duration=outro_duration)
+        woutro = WalkDefinition.model_construct(
+            image=outro, audio=audio_outro, duration=outro_duration
+        )
 
         return wintro, wwalk, woutro
 
@@ -1,17 +1,25 @@
+import asyncio
+import hashlib
+import itertools
+import logging
 import os
-import threading
 import time
 from contextlib import asynccontextmanager
-from datetime import datetime
+from typing import Dict, Optional, Tuple
 from urllib.parse import parse_qs
 
 import zmq
+import zmq.asyncio
+from pydantic_core import to_json
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
 
 from xwalk2.models import (
+    Animations,
     APIQueueClear,
     APIButtonPress,
     APIQueueWalk,
@@ -21,9 +29,13 @@ from xwalk2.models import (
     APITimerExpired,
     SysCommand,
 )
+from xwalk2.util import subscribe
 
+logger = logging.getLogger(__name__)
 
 CONTROLLER_ADDRESS = "tcp://localhost:5559"
+# The controller's control channel, watched by /status/stream for changes.
+CONTROL_ADDRESS = os.getenv("XWALK_CONTROLLER", "tcp://localhost:5557")
 
 # This box's hostname; used to seed the known-hosts list shown in the UI.
 OWN_HOST = os.getenv("XWALK_HOSTNAME", "crosswalk-a")
@@ -33,6 +45,24 @@ OWN_HOST = os.getenv("XWALK_HOSTNAME", "crosswalk-a")
 _MIN_EPOCH = 1577836800  # 2020-01-01 UTC
 _MAX_EPOCH = 4102444800  # 2100-01-01 UTC
 
+# Browsers may keep status pages but must check back every time: a POST
+# (button, queue, ...) doesn't invalidate a cached GET, so anything looser
+# can show the state from before the user's action. /status answers the
+# check with a 304 while its ETag still matches.
+STATUS_CACHE_CONTROL = "no-cache"
+
+# /status/stream pushes as soon as the controller announces a change. With
+# no announcements it still checks this often, for changes the control
+# channel doesn't carry (components joining, another tab queueing a walk).
+STATUS_STREAM_INTERVAL_S = 5.0
+
+# Components heartbeat every second; one not heard from for this long is
+# shown as not responding.
+COMPONENT_STALE_S = 3.0
+
+# Control messages that mean the status has changed.
+STATUS_CHANGE_MESSAGES = ["play_scene", "end_scene", "current_state", "reset"]
+
 # Heartbeat component name -> systemd unit, for the per-component restart button.
 COMPONENT_UNITS = {
     "timer": "xwalk_timer",
@@ -55,87 +85,233 @@ def _known_hosts(status) -> list:
     return sorted(hosts)
 
 
+# Requests without parameters never change, so serialize them once.
+_STATUS_REQUEST = to_json(APIStatusRequest())
+_BUTTON_PRESS = to_json(APIButtonPress())
+_TIMER_EXPIRED = to_json(APITimerExpired())
+_QUEUE_CLEAR = to_json(APIQueueClear())
+
+
 class APIController:
     def __init__(self):
-        self.context = zmq.Context()
-        self.api_socket = None  # Single REQ socket for all communication
+        # Process-wide context, shared with anything else in this process.
+        self.context = zmq.asyncio.Context.instance()
+        self.api_socket = None  # Single DEALER socket for all communication
         self.start_time = time.time()
-        # Serialize access: a REQ socket requires strict send/recv alternation,
-        # so concurrent FastAPI requests must not share it simultaneously.
-        self._lock = threading.Lock()
+        # Each request is tagged with a fresh id; a single reader task hands
+        # every reply to the future waiting on its id, so concurrent handlers
+        # can have requests in flight at once. Late replies to timed-out
+        # requests have no future left and are dropped.
+        self._request_ids = itertools.count()
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        # Last status reply: (monotonic time received, response). Status reads
+        # within _status_ttl reuse it; anything that changes state clears it.
+        self._status_cache: Optional[Tuple[float, APIResponse]] = None
+        self._status_ttl = 1.0
+        # Bumped by every state-changing request, so a status reply that was
+        # in flight across one isn't cached.
+        self._status_generation = 0
+        # (generation, task) for the status request currently in flight.
+        self._status_inflight: Optional[Tuple[int, asyncio.Future]] = None
+        self._timeout_s = 5.0
+        # Watches the control channel for announced state changes, one per
+        # process however many status streams are open. Each burst of
+        # announcements sets the current event and replaces it, waking
+        # every stream waiting on it.
+        self._watcher: Optional[asyncio.Task] = None
+        self._status_changed: Optional[asyncio.Event] = None
 
     def _open_socket(self):
-        """(Re)create the REQ socket and connect to the controller."""
+        """(Re)create the DEALER socket and connect to the controller."""
+        self._stop_reader(ConnectionError("Controller connection was reset"))
         if self.api_socket is not None:
-            # Discard a socket that may be in a bad state. LINGER=0 so a pending
-            # unsent/unreceived message doesn't block close().
+            # LINGER=0 so a pending unsent message doesn't block close().
             self.api_socket.close(linger=0)
-        self.api_socket = self.context.socket(zmq.REQ)
+        self.api_socket = self.context.socket(zmq.DEALER)
+        self.api_socket.setsockopt(zmq.LINGER, 0)
+        # Only queue requests once the controller is actually connected,
+        # rather than letting them pile up while it is down.
+        self.api_socket.setsockopt(zmq.IMMEDIATE, 1)
+        # Button presses come minutes apart; TCP keepalives stop an idle
+        # connection from being silently dropped in between.
+        self.api_socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        self.api_socket.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 60)
         self.api_socket.connect(CONTROLLER_ADDRESS)
 
     def start(self):
         """Initialize ZMQ connection"""
         try:
             self._open_socket()
-            print("API Controller initialized successfully")
-            print("Connected to controller on port 5559")
+            logger.info(f"API Controller connecting to {CONTROLLER_ADDRESS}")
         except Exception as e:
-            print(f"Failed to initialize API Controller: {e}")
+            logger.error(f"Failed to initialize API Controller: {e}")
             raise
 
+    def watch_status_changes(self):
+        """Start listening for the controller's state-change announcements."""
+        self._status_changed = asyncio.Event()
+        self._watcher = asyncio.ensure_future(self._watch_changes())
+
     def stop(self):
         """Clean up ZMQ connection"""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+        self._stop_reader(ConnectionError("API Controller stopped"))
         if self.api_socket:
             self.api_socket.close(linger=0)
-        if self.context:
-            self.context.term()
+        # The context is shared, so it is not term()'d here.
 
-    def _send_request(self, request: APIRequests) -> APIResponse:
+    async def _send_request(self, request: APIRequests) -> APIResponse:
+        return await self._send_raw(
+            to_json(request),
+            changes_state=not isinstance(request, APIStatusRequest),
+        )
+
+    def _stop_reader(self, error: Exception):
+        """Cancel the reply reader and fail every request still waiting."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _read_replies(self):
+        """Route each reply to the request waiting on its id."""
+        socket = self.api_socket
+        try:
+            while True:
+                reply_id, *_, response_data = await socket.recv_multipart()
+                future = self._pending.pop(reply_id, None)
+                if future is not None and not future.done():
+                    future.set_result(response_data)
+        except zmq.ZMQError as e:
+            logger.error(f"ZMQ communication error: {e}")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Failed to communicate with controller")
+                    )
+            self._pending.clear()
+
+    async def _send_raw(self, payload: bytes, changes_state: bool = True) -> APIResponse:
+        """Send an already-serialized request and wait for its reply"""
+        if changes_state:
+            self._status_cache = None
+            self._status_generation += 1
         if not self.api_socket:
             raise RuntimeError("API Controller not initialized")
-        # A REQ socket is a strict lockstep state machine. If a request times out
-        # (we never recv the reply) or errors mid-exchange, the socket is left in
-        # an unusable state and every later request would fail. Hold a lock so
-        # exchanges don't interleave, and rebuild the socket on any failure.
-        with self._lock:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.ensure_future(self._read_replies())
+        # The controller's REP socket treats every frame before the empty
+        # delimiter as the envelope and echoes it back, so the reply arrives
+        # as [request_id, b"", response]. Unlike REQ, a DEALER has no
+        # lockstep state to wedge when a reply never comes, and the REP side
+        # simply answers queued requests in turn.
+        request_id = next(self._request_ids).to_bytes(8, "little")
+        reply = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = reply
+        try:
+            if not await self.api_socket.poll(self._timeout_s * 1000, zmq.POLLOUT):
+                raise ConnectionError("Controller is not connected")
+            # Bytes end to end: no str encode/decode around the JSON.
+            await self.api_socket.send_multipart([request_id, b"", payload])
             try:
-                self.api_socket.send_string(request.model_dump_json())
-                if self.api_socket.poll(timeout=5000):
-                    response_data = self.api_socket.recv_string()
-                    return APIResponse.model_validate_json(response_data)
-                else:
-                    self._open_socket()  # reset the wedged REQ socket
-                    raise TimeoutError("Controller did not respond within timeout")
-            except zmq.ZMQError as e:
-                print(f"ZMQ communication error: {e}")
-                self._open_socket()  # reset the wedged REQ socket
-                raise ConnectionError("Failed to communicate with controller")
-
-    def timer_expired(self) -> APIResponse:
+                response_data = await asyncio.wait_for(reply, self._timeout_s)
+            except asyncio.TimeoutError:
+                raise TimeoutError("Controller did not respond within timeout")
+        except zmq.ZMQError as e:
+            logger.error(f"ZMQ communication error: {e}")
+            self._open_socket()
+            raise ConnectionError("Failed to communicate with controller")
+        finally:
+            self._pending.pop(request_id, None)
+        return APIResponse.model_validate_json(response_data)
+
+    async def timer_expired(self) -> APIResponse:
         """Send timer expired event"""
-        return self._send_request(APITimerExpired())
+        return await self._send_raw(_TIMER_EXPIRED)
 
-    def press_button(self) -> APIResponse:
-        return self._send_request(APIButtonPress())
+    async def press_button(self) -> APIResponse:
+        return await self._send_raw(_BUTTON_PRESS)
 
-    def queue_walk(self, walk: str) -> APIResponse:
+    async def queue_walk(self, walk: str) -> APIResponse:
         """Queue a walk animation"""
         request = APIQueueWalk(walk=walk)
-        return self._send_request(request)
-
-    def queue_clear(self) -> APIResponse:
-        """Queue a walk animation"""
-        request = APIQueueClear()
-        return self._send_request(request)
-
-    def get_status(self) -> APIResponse:
-        request = APIStatusRequest()
-        return self._send_request(request)
-
-    def sys_command(self, action, target="all", unit=None, epoch=None) -> APIResponse:
+        return await self._send_request(request)
+
+    async def queue_clear(self) -> APIResponse:
+        """Clear the walk queue"""
+        return await self._send_raw(_QUEUE_CLEAR)
+
+    async def get_status(self) -> APIResponse:
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self._status_ttl:
+            return self._status_cache[1]
+        # Callers arriving while a status request is already on its way share
+        # its reply, unless state has changed since it was sent.
+        generation = self._status_generation
+        if self._status_inflight and self._status_inflight[0] == generation:
+            return await asyncio.shield(self._status_inflight[1])
+
+        task = asyncio.ensure_future(
+            self._send_raw(_STATUS_REQUEST, changes_state=False)
+        )
+        # Mark a failure as seen even if every waiter was cancelled.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._status_inflight = (generation, task)
+        try:
+            response = await asyncio.shield(task)
+        finally:
+            if self._status_inflight and self._status_inflight[1] is task:
+                self._status_inflight = None
+        if generation == self._status_generation:
+            self._status_cache = (time.monotonic(), response)
+        return response
+
+    def forget_status(self):
+        """Drop the cached status, e.g. after hearing that it changed."""
+        self._status_cache = None
+        self._status_generation += 1
+
+    @property
+    def status_changed(self) -> asyncio.Event:
+        """Set on the next announced state change.
+
+        Take it before reading the status, so a change announced during the
+        read isn't missed.
+        """
+        if self._status_changed is None:
+            self._status_changed = asyncio.Event()
+        return self._status_changed
+
+    async def _watch_changes(self):
+        socket = self.context.socket(zmq.SUB)
+        socket.setsockopt(zmq.LINGER, 0)
+        subscribe(socket, STATUS_CHANGE_MESSAGES)
+        socket.connect(CONTROL_ADDRESS)
+        try:
+            while True:
+                await socket.recv()
+                # One refresh covers however many messages arrived.
+                while True:
+                    try:
+                        await socket.recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                self.forget_status()
+                changed, self._status_changed = self.status_changed, asyncio.Event()
+                changed.set()
+        finally:
+            socket.close()
+
+    async def sys_command(self, action, target="all", unit=None, epoch=None) -> APIResponse:
         """Ask the controller to broadcast a system-control command to the
         per-host sys_control agents."""
-        return self._send_request(
+        return await self._send_request(
             SysCommand(action=action, target=target, unit=unit, epoch=epoch)
         )
 
@@ -146,6 +322,7 @@ api_controller = APIController()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     api_controller.start()
+    api_controller.watch_status_changes()
     yield
     api_controller.stop()
 
@@ -159,36 +336,148 @@ app = FastAPI(
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 templates = Jinja2Templates(directory="templates")
+# Templates only change on deploy, which restarts the API: don't stat them on
+# every render, and keep their compiled bytecode across restarts.
+templates.env.auto_reload = False
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 # Available to every template for the per-component restart buttons.
 templates.env.globals["component_units"] = COMPONENT_UNITS
+# Templates are compiled once and rendered directly, skipping
+# TemplateResponse's per-request template lookup.
+_index_template = templates.get_template("index.html")
+_status_template = templates.get_template("components/status.html")
+_animations_template = templates.get_template("components/animations.html")
 
+# (animations, html, digest) for the last rendered animation list. The
+# controller's config only changes when it restarts, so the list of walk
+# buttons -- most of the status fragment -- is rendered once and reused.
+_animations_render: Optional[Tuple[Animations, Markup, bytes]] = None
 
-def _status_response(request: Request, status, notice: str):
-    """Render the status partial with an optional one-off notice."""
-    return templates.TemplateResponse(
-        "components/status.html",
-        {"request": request, "status": status, "now": datetime.now(), "notice": notice},
+
+def _animations_rendered(animations: Animations) -> Tuple[Markup, bytes]:
+    """The animations block and its digest, reused while unchanged."""
+    global _animations_render
+    if _animations_render is None or _animations_render[0] != animations:
+        html = Markup(_animations_template.render(animations=animations))
+        digest = hashlib.blake2b(html.encode(), digest_size=16).digest()
+        _animations_render = (animations, html, digest)
+    return _animations_render[1], _animations_render[2]
+
+
+def _render_animations(animations: Animations) -> Markup:
+    """The animations block of the status partial, reused while unchanged."""
+    return _animations_rendered(animations)[0]
+
+
+def _stale_components(status: APIResponse) -> frozenset:
+    """Components not heard from within COMPONENT_STALE_S.
+
+    Measured on the controller's clock, which stamped the heartbeats too.
+    """
+    now = status.timestamp.timestamp()
+    return frozenset(
+        name
+        for name, last_seen in status.components.items()
+        if now - last_seen > COMPONENT_STALE_S
     )
 
 
+def _status_digest(status: APIResponse) -> str:
+    """Content hash of the state a status fragment shows.
+
+    The controller time and the components' exact last-seen times are left
+    out: they change on every reply, while the state behind the page does
+    not. Whether each component is still responding is included.
+    """
+    digest = hashlib.blake2b(
+        APIResponse.__pydantic_serializer__.to_json(
+            status, exclude={"timestamp", "components", "animations"}
+        ),
+        digest_size=16,
+    )
+    stale = _stale_components(status)
+    digest.update(
+        to_json([(name, name in stale) for name in sorted(status.components)])
+    )
+    digest.update(_animations_rendered(status.animations)[1])
+    return digest.hexdigest()
+
+
+def _render_status(request: Request, status, notice: str = "") -> str:
+    """The status partial, with an optional one-off notice."""
+    # "now" is epoch seconds, sampled once per render; the template
+    # only uses it for "last seen N seconds ago".
+    return _status_template.render(
+        request=request,
+        status=status,
+        now=time.time(),
+        stale=_stale_components(status),
+        notice=notice,
+        animations_html=_render_animations(status.animations),
+    )
+
+
+# (status, html) for the last plain status render. get_status hands out the
+# same APIResponse object for the whole cache TTL, so polls and streams
+# within it reuse one render; "last seen" ages are then at most that TTL
+# old, just like the status itself.
+_status_render: Optional[Tuple[APIResponse, str]] = None
+
+
+def _render_status_cached(request: Request, status: APIResponse) -> str:
+    """The notice-free status partial, memoized per status."""
+    global _status_render
+    if _status_render is None or _status_render[0] is not status:
+        _status_render = (status, _render_status(request, status))
+    return _status_render[1]
+
+
+def _status_response(request: Request, status, notice: str = "") -> HTMLResponse:
+    """Render the status partial with an optional one-off notice."""
+    return HTMLResponse(_render_status(request, status, notice))
+
+
+# The controller-down messages never vary, so encode them once rather than on
+# every failed request while the controller is away.
+_CONTROLLER_TIMEOUT_HTML = (
+    "<p><strong>⚠️ Controller did not respond; try again shortly.</strong></p>"
+).encode()
+_CONTROLLER_UNREACHABLE_HTML = (
+    "<p><strong>⚠️ Controller unreachable.</strong></p>"
+).encode()
+
+
+@app.exception_handler(TimeoutError)
+async def controller_timeout(request: Request, exc: TimeoutError):
+    return HTMLResponse(_CONTROLLER_TIMEOUT_HTML, status_code=503)
+
+
+@app.exception_handler(ConnectionError)
+async def controller_unreachable(request: Request, exc: ConnectionError):
+    return HTMLResponse(_CONTROLLER_UNREACHABLE_HTML, status_code=503)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
-    status = api_controller.get_status()
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "status": status,
-            "now": datetime.now(),
-            "hosts": _known_hosts(status),
-        },
+    status = await api_controller.get_status()
+    response = HTMLResponse(
+        _index_template.render(
+            request=request,
+            status=status,
+            now=time.time(),
+            stale=_stale_components(status),
+            hosts=_known_hosts(status),
+            animations_html=_render_animations(status.animations),
+        )
     )
+    response.headers["Cache-Control"] = STATUS_CACHE_CONTROL
+    return response
 
 
 @app.post("/restart/all", response_class=HTMLResponse)
 async def restart_all(request: Request):
     """Restart all xwalk components on every box."""
-    resp = api_controller.sys_command("restart_all", target="all")
+    resp = await api_controller.sys_command("restart_all", target="all")
     return _status_response(request, resp, resp.message)
 
 
@@ -196,65 +485,94 @@ async def restart_all(request: Request):
 async def restart_unit(host: str, unit: str, request: Request):
     """Restart one component (or all, if unit == 'all') on a specific box."""
     if unit == "all":
-        resp = api_controller.sys_command("restart_all", target=host)
+        resp = await api_controller.sys_command("restart_all", target=host)
     else:
-        resp = api_controller.sys_command("restart", target=host, unit=unit)
+        resp = await api_controller.sys_command("restart", target=host, unit=unit)
     return _status_response(request, resp, resp.message)
 
 
 @app.post("/reboot/{host}", response_class=HTMLResponse)
 async def reboot(host: str, request: Request):
     """Reboot a box, or all of them when host == 'all'."""
-    resp = api_controller.sys_command("reboot", target=host)
+    resp = await api_controller.sys_command("reboot", target=host)
     return _status_response(request, resp, resp.message)
 
 
 @app.get("/status", response_class=HTMLResponse)
 async def status_view(request: Request):
-    status = api_controller.get_status()
-    return templates.TemplateResponse(
-        "components/status.html",
-        {"request": request, "status": status, "now": datetime.now()},
+    status = await api_controller.get_status()
+    # Tagged by state, not by the rendered bytes: a client holding the same
+    # state keeps its copy (with its older ages) and nothing is rendered.
+    etag = f'"{_status_digest(status)}"'
+    headers = {"Cache-Control": STATUS_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    html = _render_status_cached(request, status)
+    return HTMLResponse(html, headers=headers)
+
+
+@app.get("/status/stream")
+async def status_stream(request: Request):
+    """Server-sent events carrying the status fragment whenever it changes."""
+
+    async def events():
+        last_digest = None
+        while not await request.is_disconnected():
+            # Woken by the controller's own announcements rather than by
+            # polling; api_controller has already dropped its cached status.
+            changed = api_controller.status_changed
+            try:
+                status = await api_controller.get_status()
+            except (TimeoutError, ConnectionError):
+                # The controller is away; keep the last fragment on screen.
+                pass
+            else:
+                # Only a change of state is pushed, which includes a
+                # component going quiet or coming back; ages ticking
+                # over alone don't replace the page under the user.
+                digest = _status_digest(status)
+                if digest != last_digest:
+                    last_digest = digest
+                    html = _render_status_cached(request, status)
+                    # Each line of a multi-line payload needs its own data field.
+                    yield "".join(f"data: {line}\n" for line in html.splitlines()) + "\n"
+            try:
+                await asyncio.wait_for(changed.wait(), STATUS_STREAM_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
     )
 
 
 @app.post("/button", response_class=HTMLResponse)
 async def press_button(request: Request):
     """Handle button press action (htmx or API)"""
-    status = api_controller.press_button()
-    return templates.TemplateResponse(
-        "components/status.html",
-        {"request": request, "status": status, "now": datetime.now()},
-    )
+    status = await api_controller.press_button()
+    return _status_response(request, status)
 
 
 @app.post("/queue/{walk}", response_class=HTMLResponse)
 async def queue(walk: str, request: Request):
     """Handle button press action (htmx or API)"""
-    status = api_controller.queue_walk(walk)
-    return templates.TemplateResponse(
-        "components/status.html",
-        {"request": request, "status": status, "now": datetime.now()},
-    )
+    status = await api_controller.queue_walk(walk)
+    return _status_response(request, status)
 
 @app.delete("/queue/", response_class=HTMLResponse)
 async def queue_clear(request: Request):
     """Handle button press action (htmx or API)"""
-    status = api_controller.queue_clear()
-    return templates.TemplateResponse(
-        "components/status.html",
-        {"request": request, "status": status, "now": datetime.now()},
-    )
+    status = await api_controller.queue_clear()
+    return _status_response(request, status)
 
 
 @app.post("/timer", response_class=HTMLResponse)
 async def fire_timer(request: Request):
     """Handle timer expired action (htmx or API)"""
-    status = api_controller.timer_expired()
-    return templates.TemplateResponse(
-        "components/status.html",
-        {"request": request, "status": status, "now": datetime.now()},
-    )
+    status = await api_controller.timer_expired()
+    return _status_response(request, status)
 
 
 @app.post("/clock", response_class=HTMLResponse)
@@ -274,13 +592,13 @@ async def set_clock(request: Request):
         seconds = None
 
     if seconds is None:
-        resp = api_controller.get_status()
+        resp = await api_controller.get_status()
         notice = "Missing or invalid time value; clock unchanged."
     elif not (_MIN_EPOCH <= seconds < _MAX_EPOCH):
-        resp = api_controller.get_status()
+        resp = await api_controller.get_status()
         notice = f"Refused implausible time ({seconds:.0f}); clock unchanged."
     else:
-        resp = api_controller.sys_command("set_clock", target="all", epoch=seconds)
+        resp = await api_controller.sys_command("set_clock", target="all", epoch=seconds)
         notice = "🕐 " + resp.message
     return _status_response(request, resp, notice)
 
@@ -288,5 +606,20 @@ async def set_clock(request: Request):
 if __name__ == "__main__":
     import uvicorn
 
-    print("🚀 Starting Crosswalk V2 API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    logger.info("🚀 Starting Crosswalk V2 API server...")
+    # One process: api_controller holds the only controller socket. "auto"
+    # picks uvloop/httptools when they are installed and falls back to the
+    # stdlib otherwise; per-request access logging is off.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        access_log=False,
+        workers=1,
+    )
@@ -1,5 +1,7 @@
 from typing import List
 import logging
+import os
+import signal
 import subprocess
 
 from pydantic import BaseModel
@@ -13,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 
 class AudioPlayer(SubscribeComponent):
+    message_types = ["play_scene", "end_scene", "reset"]
+
     def __init__(
         self,
         component_name: str,
@@ -25,38 +29,52 @@ class AudioPlayer(SubscribeComponent):
             component_name, host_name, subscribe_address, heartbeat_address
         )
         self.audio = AudioLibrary(audio_root)
+        # The library maps names to Paths; keep the argv-ready strings.
+        self._paths = {name: str(path) for name, path in self.audio.file_map.items()}
         self._process = None
         self._playing: List[WalkDefinition] = []
+        # Stop any in-progress playback when the scene ends or is reset,
+        # matching the matrix/button-light components.
+        self._handlers = {
+            PlayScene: self._on_play_scene,
+            EndScene: lambda message: self.kill(),
+            ResetCommand: lambda message: self.kill(),
+        }
 
     def process_message(self, message: BaseModel):
-        if isinstance(message, PlayScene):
-            self.play_all([message.intro, message.walk, message.outro])
-            #self.play(message.walk)
-        elif isinstance(message, (EndScene, ResetCommand)):
-            # Stop any in-progress playback when the scene ends or is reset,
-            # matching the matrix/button-light components.
-            self.kill()
-
-    def _build_command(self, animation):
+        handler = self._handlers.get(type(message))
+        if handler is not None:
+            handler(message)
+
+    def _on_play_scene(self, message: PlayScene):
+        self.play_all([message.intro, message.walk, message.outro])
+
+    def _build_command(self, *animations):
         """
-        Return a list of command line arguments for showing the animated image.
+        Return a list of command line arguments for playing the given audio,
+        one after another, in a single mpg123 process.
         """
         args = []
         args.extend(MPG123_COMMAND)
-        args.append(str(self.audio[animation]))
+        args.extend(self._paths[animation] for animation in animations)
         return args
 
-    def _exec(self, command, shell=False):
+    def _exec(self, command):
         """Execute a new subprocess command."""
         self.kill()
         logger.debug("Executing: %s", command)
-        self._process = subprocess.Popen(command, shell=shell)
+        # Its own process group, so kill() reaches anything mpg123 spawns.
+        self._process = subprocess.Popen(command, start_new_session=True)
 
     def kill(self):
         if self._process:
             # logger.debug("Killing: %s", self.playing())
-            subprocess.call(["/usr/bin/pkill", "-P", str(self._process.pid)])
-            self._process.kill()
+            try:
+                # A new session's process group id is the leader's pid.
+                os.killpg(self._process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # Already finished playing.
+            self._process.wait()
             self._process = None
         self._playing = []
 
@@ -74,13 +92,12 @@ class AudioPlayer(SubscribeComponent):
     def play_all(self, audios: List[WalkDefinition]):
         self.kill()
 
-        commands = [" ".join(self._build_command(w.audio)) for w in audios]
-
-        script = " && ".join(commands)
+        # One mpg123 for the whole scene: no shell, and the audio device is
+        # opened once instead of once per clip.
+        command = self._build_command(*(w.audio for w in audios))
 
         logger.info("Playing all: %s", audios)
-        logger.info("Script: %s", script)
-        self._exec(script, shell=True)
+        self._exec(command)
         self._playing = audios
 
 
@@ -1,6 +1,5 @@
 import logging
 
-from gpiozero import LED
 from pydantic import BaseModel
 
 from xwalk2.models import CurrentState, EndScene, PlayScene
@@ -10,6 +9,10 @@ logger = logging.getLogger(__name__)
 
 
 class ButtonLight(SubscribeComponent):
+    message_types = ["play_scene", "end_scene", "current_state"]
+    # The light only shows the latest state; skip superseded messages.
+    latest_only = True
+
     def __init__(
         self,
         component_name: str,
@@ -20,22 +23,51 @@ class ButtonLight(SubscribeComponent):
         super().__init__(
             component_name, host_name, subscribe_address, heartbeat_address
         )
-        self.led = LED(24)
+        self.led = self._make_led()
 
         self.led.off()
+        # What the LED was last set to. This component is the only thing
+        # driving it, so no need to read the pin back.
+        self._lit = False
 
-    def process_message(self, message: BaseModel):
-        if isinstance(message, PlayScene):
-            self.led.off()
-        elif isinstance(message, EndScene):
-            self.led.on()
-        elif isinstance(message, CurrentState):
-            if message.state == "walk":
-                self.led.off()
-            elif message.state == "ready":
+        # Message type -> handler, and FSM state -> what the light does.
+        self._handlers = {
+            PlayScene: lambda message: self._set_led(False),
+            EndScene: lambda message: self._set_led(True),
+            CurrentState: self._on_state,
+        }
+        self._state_actions = {
+            "walk": False,
+            "ready": True,
+        }
+
+    def _make_led(self):
+        """The LED this component drives."""
+        # Imported here so the virtual light runs without gpiozero installed.
+        from gpiozero import LED
+
+        return LED(24)
+
+    def _set_led(self, lit: bool):
+        """Turn the LED on or off, skipping the write if it already is."""
+        if lit != self._lit:
+            if lit:
                 self.led.on()
             else:
-                print(f"Unknown State {message=}")
+                self.led.off()
+            self._lit = lit
+
+    def process_message(self, message: BaseModel):
+        handler = self._handlers.get(type(message))
+        if handler is not None:
+            handler(message)
+
+    def _on_state(self, message: CurrentState):
+        lit = self._state_actions.get(message.state)
+        if lit is None:
+            logger.warning("Unknown state %r", message)
+        else:
+            self._set_led(lit)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 import logging
 
-from pydantic import BaseModel
+from xwalk2 import button_light
+from xwalk2.util import add_default_args
 
-from xwalk2.models import CurrentState, EndScene, PlayScene
-from xwalk2.util import SubscribeComponent, add_default_args
+logger = logging.getLogger(__name__)
 
 
 class VirtualLED:
@@ -11,41 +11,23 @@ class VirtualLED:
         self.light = "off"
 
     def on(self):
-        self.light = "on"
-        print(f"{self.light=}")
+        self._set("on")
 
     def off(self):
-        self.light = "off"
-        print(f"{self.light=}")
+        self._set("off")
 
+    def _set(self, light: str):
+        if light != self.light:
+            self.light = light
+            logger.debug("light=%s", light)
 
-class ButtonLight(SubscribeComponent):
-    def __init__(
-        self,
-        component_name: str,
-        host_name: str,
-        subscribe_address: str,
-        heartbeat_address: str,
-    ) -> None:
-        super().__init__(
-            component_name, host_name, subscribe_address, heartbeat_address
-        )
-        self.led = VirtualLED()
 
-        self.led.off()
+class ButtonLight(button_light.ButtonLight):
+    """The button light, logging (at debug) each change of state instead of
+    driving GPIO."""
 
-    def process_message(self, message: BaseModel):
-        if isinstance(message, PlayScene):
-            self.led.off()
-        elif isinstance(message, EndScene):
-            self.led.on()
-        elif isinstance(message, CurrentState):
-            if message.state == "walk":
-                self.led.off()
-            elif message.state == "ready":
-                self.led.on()
-            else:
-                print(f"Unknown state {message=}")
+    def _make_led(self):
+        return VirtualLED()
 
 
 if __name__ == "__main__":
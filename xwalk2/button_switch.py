@@ -1,7 +1,6 @@
 import logging
 import os
 import time
-from datetime import datetime
 
 from gpiozero import Button
 
@@ -23,21 +22,36 @@ class PhysicalButton(InteractComponent):
         self.button_pin = int(os.getenv("XWALK_BUTTON_PIN", 25))
         self.button = Button(self.button_pin, pull_up=True, bounce_time=0.05)
         logger.info(f"Initialized button with pin {self.button_pin}")
+        # Optionally keep the button on a core of its own (e.g. one reserved
+        # with isolcpus) so other processes can't delay a press.
+        button_cpu = os.getenv("XWALK_BUTTON_CPU")
+        if button_cpu is not None:
+            os.sched_setaffinity(0, {int(button_cpu)})
+            logger.info(f"Pinned button process to CPU {button_cpu}")
 
     def loop(self):
+        # Looked up once, so the press path runs on local names only.
+        wait_for_press = self.button.wait_for_press
+        wait_for_release = self.button.wait_for_release
+        monotonic_ns = time.monotonic_ns
+        time_ns = time.time_ns
+        send_action = self.send_action
+        host_name = self.host_name
+        component_name = self.component_name
         while True:
-            self.button.wait_for_press()
-            s = time.time()
-            self.button.wait_for_release()
-            d = round((time.time() - s) * 1000)  # convert S -> MS
+            wait_for_press()
+            pressed_ns = monotonic_ns()
+            wait_for_release()
+            # Monotonic, so a clock change mid-press can't skew the duration.
+            d = (monotonic_ns() - pressed_ns) // 1_000_000  # ns -> ms
             button_press = ButtonPress(
-                host=self.host_name,
-                component=self.component_name,
+                host=host_name,
+                component=component_name,
                 press_duration=d,
-                sent_at=datetime.now(),
+                sent_at_ns=time_ns(),
             )
             logger.info(f"button press duration={d} ms")
-            self.send_action(button_press)
+            send_action(button_press)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 import argparse
 import logging
+import os
+import sys
+import termios
 import time
-from datetime import datetime
+import tty
+
+import zmq
 
 from xwalk2.models import ButtonPress
 from xwalk2.util import InteractComponent, add_default_args
@@ -21,24 +26,44 @@ class VirtualButton(InteractComponent):
         logger.info("Initialized virtual button")
 
     def loop(self):
-        while True:
-            input("Press enter to simulate button press down")
-            logging.info("Button pressed")
-            press_start = time.time()
-
-            input("Press enter to simulate button release")
-            press_duration = int(
-                (time.time() - press_start) * 1000
-            )  # Convert to milliseconds
-
-            button_press = ButtonPress(
-                host=self.host_name,
-                component=self.component_name,
-                press_duration=press_duration,
-                sent_at=datetime.now(),
-            )
-            logging.info(f"button press duration={press_duration}ms")
-            self.send_action(button_press)
+        fd = sys.stdin.fileno()
+        # Waits on stdin with no timeout; the heartbeat has its own thread.
+        poller = zmq.Poller()
+        poller.register(fd, zmq.POLLIN)
+        saved_mode = termios.tcgetattr(fd) if os.isatty(fd) else None
+        if saved_mode is not None:
+            # React to each key as it is typed rather than to whole lines.
+            tty.setcbreak(fd)
+        print("Press any key to press the button down, and again to release it")
+        pressed_ns = None
+        try:
+            while True:
+                if not poller.poll():
+                    continue
+                key = os.read(fd, 1)
+                # Timestamped as soon as the key is readable, on a clock that
+                # set_clock can't move.
+                now_ns = time.monotonic_ns()
+                if not key:
+                    return  # stdin closed
+                if pressed_ns is None:
+                    pressed_ns = now_ns
+                    logger.info("Button pressed")
+                    continue
+
+                press_duration = (now_ns - pressed_ns) // 1_000_000  # ns -> ms
+                pressed_ns = None
+                button_press = ButtonPress(
+                    host=self.host_name,
+                    component=self.component_name,
+                    press_duration=press_duration,
+                    sent_at_ns=time.time_ns(),
+                )
+                logger.info(f"button press duration={press_duration}ms")
+                self.send_action(button_press)
+        finally:
+            if saved_mode is not None:
+                termios.tcsetattr(fd, termios.TCSADRAIN, saved_mode)
 
 
 if __name__ == "__main__":
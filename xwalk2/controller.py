@@ -1,11 +1,14 @@
 from datetime import datetime
 import logging
+import time
 
 import zmq
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from xwalk2.fsm import Controller
 from xwalk2.models import (
+    Animations,
     APIResponse,
     APIQueueClear,
     APIQueueWalk,
@@ -23,11 +26,26 @@ from xwalk2.models import (
 
 logger = logging.getLogger(__name__)
 
+
+def encode_animations(animations: Animations) -> bytes:
+    """The animations field of an API reply, for encode_response()"""
+    return b',"animations":' + to_json(animations) + b"}"
+
+
+def encode_response(response: APIResponse, animations_json: bytes) -> bytes:
+    """Serialize an API response, splicing in the pre-serialized animation
+    config rather than serializing it again."""
+    rest = APIResponse.__pydantic_serializer__.to_json(
+        response, exclude={"animations"}
+    )
+    return rest[:-1] + animations_json
+
+
 def main():
     print("Starting Crosswalk V2 Controller with FSM...")
     print("Initializing ZMQ sockets...")
 
-    context = zmq.Context()
+    context = zmq.Context.instance()
     interactions = context.socket(zmq.SUB)
     interactions.bind("tcp://*:5556")
     interactions.setsockopt_string(zmq.SUBSCRIBE, "")
@@ -65,10 +83,16 @@ def main():
 
     # Initialize FSM controller
     state = Controller(send_command)
+    # Measure all of the audio now rather than on the first button presses.
+    state.animations.preload_durations()
 
     playing = False
     components = {}
 
+    # The animation config is loaded once and is most of every API reply, so
+    # serialize it once and splice it into each reply.
+    animations_json = encode_animations(state.animations.config)
+
     def make_response(message: str = "", success: bool = True) -> APIResponse:
         """Create a standard API response"""
         return  APIResponse(
@@ -131,88 +155,117 @@ def main():
 
     # Main control loop, wrapped in try for graceful shutdown
     last_state = state.state
+    # The CurrentState last sent to joining components, and when.
+    last_state_sent, last_state_sent_at = None, 0.0
     print(f"🎛️  FSM State: {state.state} | Playing: {playing}")
     try:
         while True:
-            # Update playing status based on FSM state, but only when changed
-            if state.state != last_state:
-                playing = state.state == "walk"
-                print(f"🎛️  FSM State: {state.state} | Playing: {playing}")
-                last_state = state.state
-
             new_component = False
             try:
-                socks = dict(poller.poll(1000))  # 1 second timeout
+                # Nothing here is periodic, so sleep until a socket is ready.
+                events = poller.poll()
             except KeyboardInterrupt:
                 print("\nShutting down controller...")
                 break
 
-            if heartbeats in socks:
-                beat = Heartbeat.model_validate_json(heartbeats.recv_string())
-                component_name = f"{beat.component}/{beat.host}"
-                if component_name not in components or beat.initial:
-                    logger.info(f"{component_name} sent {beat.initial} or {component_name in components}")
-                    new_component = True
-                # Record liveness on the controller's own clock, not the
-                # sender's (beat.sent_at). The signs have no RTC and can run on
-                # skewed clocks; trusting the remote timestamp made "last seen"
-                # nonsensical (e.g. negative when a sign's clock ran ahead).
-                now = datetime.now()
-                skew = (now - beat.sent_at).total_seconds()
-                if abs(skew) > 30:
-                    logger.warning(
-                        "Clock skew: %s heartbeat sent_at is %.0fs from controller time",
-                        component_name,
-                        skew,
-                    )
-                components[component_name] = now
+            for sock, _ in events:
+                if sock is heartbeats:
+                    # Every component beats on this socket, so service all of the
+                    # queued heartbeats before going back to poll.
+                    while True:
+                        try:
+                            raw_beat = heartbeats.recv(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+                        # One bad beat (e.g. from a component on another
+                        # release) must not take the controller down.
+                        try:
+                            beat = Heartbeat.model_validate_json(raw_beat)
+                        except Exception:
+                            logger.exception("💥 Error handling heartbeat: %s", raw_beat)
+                            continue
+                        component_name = f"{beat.component}/{beat.host}"
+                        if component_name not in components or beat.initial:
+                            logger.info(f"{component_name} sent {beat.initial} or {component_name in components}")
+                            new_component = True
+                        # Record liveness on the controller's own clock, not the
+                        # sender's (beat.sent_at). The signs have no RTC and can run
+                        # on skewed clocks; trusting the remote timestamp made "last
+                        # seen" nonsensical (e.g. negative when a sign's clock ran
+                        # ahead).
+                        now = time.time()
+                        skew = now - beat.sent_at
+                        if abs(skew) > 30:
+                            logger.warning(
+                                "Clock skew: %s heartbeat sent_at is %.0fs from controller time",
+                                component_name,
+                                skew,
+                            )
+                        components[component_name] = now
 
-            # If there is a new component it will need our current state
-            if new_component:
-                logger.info("Sending initial state")
-                current_state = CurrentState(state=state.state)
-                send_command(current_state)
-
-            if api_socket in socks:
-                # recv must complete before we can send anything back: a REP
-                # socket requires strict recv -> send alternation. If recv
-                # itself fails (e.g. never completes), there is no request to
-                # reply to and attempting to send anyway would raise a second,
-                # unhandled zmq.ZMQError ("Operation cannot be accomplished in
-                # current state") that would crash the whole controller.
-                try:
-                    request_data = api_socket.recv_string()
-                except Exception:
-                    logger.error("Failed to receive API request", exc_info=True)
-                else:
+                elif sock is api_socket:
+                    # recv must complete before we can send anything back: a REP
+                    # socket requires strict recv -> send alternation. If recv
+                    # itself fails (e.g. never completes), there is no request to
+                    # reply to and attempting to send anyway would raise a second,
+                    # unhandled zmq.ZMQError ("Operation cannot be accomplished in
+                    # current state") that would crash the whole controller.
                     try:
-                        api_request = parse_api(request_data)
-                        response = handle_api_request(api_request)
-                        api_socket.send_string(response.model_dump_json())
-                    except Exception as e:
-                        logger.error("Error handling API request", exc_info=True)
-                        error_response = make_response(
-                            success=False,
-                            message=f"Server error: {str(e)}",
-                        )
-                        api_socket.send_string(error_response.model_dump_json())
-
-            if interactions in socks:
-                # Handle interactions from other components
-                interaction_data = interactions.recv_string()
-                print(f"📨 Received interaction: {interaction_data}")
-
-                try:
-                    action = parse_message(interaction_data)
-
-                    if isinstance(action, ButtonPress):
-                        state.button_press()
-
-                    elif isinstance(action, TimerExpired):
-                        state.timer_expired()
-                    
-                except Exception as e:
-                    logger.error("💥 Error handling interaction", exc_info=True)
+                        request_data = api_socket.recv()
+                    except Exception:
+                        logger.error("Failed to receive API request", exc_info=True)
+                    else:
+                        try:
+                            api_request = parse_api(request_data)
+                            response = handle_api_request(api_request)
+                            api_socket.send(encode_response(response, animations_json))
+                        except Exception as e:
+                            logger.error("Error handling API request", exc_info=True)
+                            error_response = make_response(
+                                success=False,
+                                message=f"Server error: {str(e)}",
+                            )
+                            api_socket.send(encode_response(error_response, animations_json))
+
+                elif sock is interactions:
+                    # Handle interactions from other components, all of those
+                    # already queued, before going back to poll.
+                    while True:
+                        try:
+                            interaction_data = interactions.recv(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+                        logger.debug("📨 Received interaction: %s", interaction_data)
+
+                        try:
+                            action = parse_message(interaction_data)
+
+                            if isinstance(action, ButtonPress):
+                                state.button_press()
+
+                            elif isinstance(action, TimerExpired):
+                                state.timer_expired()
+
+                        except Exception as e:
+                            logger.error("💥 Error handling interaction", exc_info=True)
+
+            # If there is a new component it will need our current state.
+            # Joining components flag their first few heartbeats as initial,
+            # so skip resending a state broadcast moments ago; a component
+            # that missed it is answered on its next beat.
+            if new_component:
+                now = time.monotonic()
+                if state.state != last_state_sent or now - last_state_sent_at > 0.5:
+                    logger.info("Sending initial state")
+                    current_state = CurrentState(state=state.state)
+                    send_command(current_state)
+                    last_state_sent, last_state_sent_at = state.state, now
+
+            # Update playing status based on FSM state, but only when changed
+            if state.state != last_state:
+                playing = state.state == "walk"
+                print(f"🎛️  FSM State: {state.state} | Playing: {playing}")
+                last_state = state.state
 
     except KeyboardInterrupt:
         print("\nController interrupted")
@@ -29,6 +29,8 @@ logger = logging.getLogger(__name__)
 
 
 class MatrixViewer(SubscribeComponent):
+    message_types = ["play_scene", "end_scene", "current_state"]
+
     def __init__(
         self,
         component_name: str,
@@ -43,6 +45,11 @@ class MatrixViewer(SubscribeComponent):
         self.animations = ImageLibrary(image_root)
         self._process = None
         self._playing: List[str] = []
+        self._handlers = {
+            PlayScene: self._on_play_scene,
+            EndScene: self._on_end_scene,
+            CurrentState: self._on_current_state,
+        }
 
     def _display_command(self, animation: str, shell=False, forever=False):
         """
@@ -98,16 +105,21 @@ class MatrixViewer(SubscribeComponent):
         self._playing = [animation.image]
 
     def process_message(self, message: BaseModel):
-        if isinstance(message, PlayScene):
-            self.play_all([message.intro, message.walk, message.outro, message.stop])
-            #self.play(message.walk)
-        elif isinstance(message, EndScene):
-            if self._playing != ['stop']:
-                self.play(WalkDefinition(image="stop", audio="", duration=-1))
-        elif isinstance(message, CurrentState):
-            logger.info("Got CurrentState")
-            if message.state == "ready" and self._playing != ['stop']:
-                self.play(WalkDefinition(image="stop", audio="", duration=-1))
+        handler = self._handlers.get(type(message))
+        if handler is not None:
+            handler(message)
+
+    def _on_play_scene(self, message: PlayScene):
+        self.play_all([message.intro, message.walk, message.outro, message.stop])
+
+    def _on_end_scene(self, message: EndScene):
+        if self._playing != ['stop']:
+            self.play(WalkDefinition(image="stop", audio="", duration=-1))
+
+    def _on_current_state(self, message: CurrentState):
+        logger.info("Got CurrentState")
+        if message.state == "ready" and self._playing != ['stop']:
+            self.play(WalkDefinition(image="stop", audio="", duration=-1))
 
     def play_all(self, animations: List[WalkDefinition]):
         """
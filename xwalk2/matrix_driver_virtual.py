@@ -12,7 +12,7 @@ from tkinter import Canvas
 import argparse
 import logging
 
-from xwalk2.util import HeartbeatSender, add_default_args
+from xwalk2.util import HeartbeatSender, add_default_args, subscribe
 from xwalk2.models import CurrentState, EndScene, PlayScene, ResetCommand, parse_message, WalkDefinition
 
 
@@ -323,10 +323,10 @@ def main(args):
     display.gif_player.img_base_path = Path(args.image_root)
 
     # Socket to receive commands
-    context = zmq.Context()
+    context = zmq.Context.instance()
     socket = context.socket(zmq.SUB)
     socket.connect(args.controller)
-    socket.setsockopt_string(zmq.SUBSCRIBE, "")  # Subscribe to all messages
+    subscribe(socket, ["play_scene", "current_state", "reset", "end_scene"])
 
     heartbeat_thread = HeartbeatSender(
         "matrix_display_virtual", args.hostname, args.heartbeat
@@ -1,8 +1,7 @@
-import json
 from datetime import datetime
-from typing import Dict, Literal, Optional, List, Union, Tuple
+from typing import Annotated, Dict, Literal, Optional, List, Union, Tuple
 
-from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, model_validator, field_validator
 
 # Models represent things we send over the wire for easy
 # jsonification with pydantic.
@@ -98,16 +97,44 @@ class Heartbeat(BaseModel):
     type: Literal["heartbeat"] = "heartbeat"
     host: str
     component: str
-    sent_at: datetime
+    sent_at: float | datetime  # time.time() on the sender
     initial: bool
 
+    @field_validator("sent_at", mode="after")
+    @classmethod
+    def sent_at_as_epoch(cls, value: float | datetime) -> float:
+        """Older senders send an ISO datetime; normalise to epoch seconds."""
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value
+
 
 class ButtonPress(BaseModel):
     type: Literal["button_press"] = "button_press"
     host: str
     component: str
     press_duration: int
-    sent_at: datetime
+    sent_at_ns: int  # time.time_ns() on the sender
+
+    @model_validator(mode="before")
+    @classmethod
+    def legacy_sent_at(cls, data):
+        """Older buttons send `sent_at` (an ISO datetime, or epoch seconds)
+        instead of `sent_at_ns`."""
+        if isinstance(data, dict) and "sent_at_ns" not in data and "sent_at" in data:
+            sent_at = data["sent_at"]
+            if isinstance(sent_at, str):
+                sent_at = datetime.fromisoformat(sent_at)
+            if isinstance(sent_at, datetime):
+                sent_at = sent_at.timestamp()
+            # Raised as ValueError so pydantic reports a ValidationError.
+            if isinstance(sent_at, bool) or not isinstance(sent_at, (int, float)):
+                raise ValueError(
+                    f"sent_at must be a datetime or epoch seconds, not {sent_at!r}"
+                )
+            data = {**data, "sent_at_ns": int(sent_at * 1_000_000_000)}
+            del data["sent_at"]
+        return data
 
 
 class APIQueueWalk(BaseModel):
@@ -145,7 +172,7 @@ class APIResponse(BaseModel):
     message: str
     success: bool
     playing: bool
-    components: Dict[str, datetime]
+    components: Dict[str, float]  # last heartbeat, epoch seconds
     timestamp: datetime
     state: str
     animations: Animations
@@ -213,26 +240,6 @@ class SysCommand(BaseModel):
     epoch: Optional[float] = None  # unix seconds for action == "set_clock"
 
 
-message_registry = {
-    "button_press": ButtonPress,
-    "heartbeat": Heartbeat,
-    "play_scene": PlayScene,
-    "end_scene": EndScene,
-    "current_state": CurrentState,
-    "reset": ResetCommand,
-    "timer_expired": TimerExpired,
-    "sys_command": SysCommand,
-}
-
-api_registry = {
-    "queue_walk": APIQueueWalk,
-    "queue_clear": APIQueueClear,
-    "press_button": APIButtonPress,
-    "timer_expired": APITimerExpired,
-    "status": APIStatusRequest,
-    "sys_command": SysCommand,
-}
-
 APIRequests = (
     APIQueueWalk
     | APIButtonPress
@@ -243,20 +250,39 @@ APIRequests = (
 )
 
 
-def parse_api(request: str) -> BaseModel:
-    data = json.loads(request)
-    msg_type = data.get("type")
-    model_cls = api_registry.get(msg_type)
-    if model_cls is None:
-        raise ValueError(f"Unknown message type: {msg_type}")
-    return model_cls(**data)
+def topic(msg_type: str) -> str:
+    """ZMQ SUBSCRIBE prefix matching messages of the given type.
+
+    Every message model declares `type` as its first field, so its JSON
+    always starts with this prefix.
+    """
+    return f'{{"type":"{msg_type}"'
+
+
+# Built once: validates API requests straight from the wire, picking the
+# model by its `type` tag, without an intermediate dict.
+_api_adapter = TypeAdapter(Annotated[APIRequests, Field(discriminator="type")])
+
+
+def parse_api(request: str | bytes) -> BaseModel:
+    """Parse an API request; raises ValueError for unknown or invalid ones."""
+    return _api_adapter.validate_json(request)
+
+
+Messages = (
+    ButtonPress
+    | Heartbeat
+    | PlayScene
+    | EndScene
+    | CurrentState
+    | ResetCommand
+    | TimerExpired
+    | SysCommand
+)
+
+_message_adapter = TypeAdapter(Annotated[Messages, Field(discriminator="type")])
 
 
-def parse_message(message_str: str) -> BaseModel:
+def parse_message(message_str: str | bytes) -> BaseModel:
     """Parse message string into appropriate model"""
-    data = json.loads(message_str)
-    msg_type = data.get("type")
-    model_cls = message_registry.get(msg_type)
-    if model_cls is None:
-        raise ValueError(f"Unknown message type: {msg_type}")
-    return model_cls(**data)
+    return _message_adapter.validate_json(message_str)
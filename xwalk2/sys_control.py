@@ -21,6 +21,8 @@ class SysControl(SubscribeComponent):
     the root-owned crosswalk-ctl helper, so no SSH between boxes is required.
     """
 
+    message_types = ["sys_command"]
+
     def _run(self, *args: str) -> None:
         cmd = ["sudo", "-n", CTL_CMD, *args]
         logger.info("Running %s", cmd)
@@ -4,6 +4,7 @@ from typing import Optional
 
 import zmq
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from xwalk2.models import EndScene, PlayScene, ResetCommand, TimerExpired
 from xwalk2.util import SubscribeInteractComponent, add_default_args
@@ -14,6 +15,8 @@ logger = logging.getLogger(__name__)
 class SceneTimer(SubscribeInteractComponent):
     """Scene timer with audio-duration detection and command handling"""
 
+    message_types = ["play_scene", "reset", "end_scene"]
+
     def __init__(
         self,
         component_name: str,
@@ -33,17 +36,20 @@ class SceneTimer(SubscribeInteractComponent):
         self.timer_lock = threading.Lock()
         self.timer_id_counter = 0
         self.last_timer_id = None
+        self._handlers = {
+            PlayScene: self._on_play_scene,
+            ResetCommand: lambda message: self.stop_timer(),
+            EndScene: lambda message: self.stop_timer(),
+        }
 
     def process_message(self, message: BaseModel):
-        if isinstance(message, PlayScene):
-            print(f"🎬 Play scene command - using sequence durations")
-            self.start_scene_timer(message, self.interact_socket)
-
-        elif isinstance(message, ResetCommand):
-            self.stop_timer()
+        handler = self._handlers.get(type(message))
+        if handler is not None:
+            handler(message)
 
-        elif isinstance(message, EndScene):
-            self.stop_timer()
+    def _on_play_scene(self, message: PlayScene):
+        logger.debug("🎬 Play scene command - using sequence durations")
+        self.start_scene_timer(message, self.interact_socket)
 
     def start_scene_timer(self, play_cmd: PlayScene, interaction_socket: zmq.Socket):
         """Start timer for scene duration"""
@@ -63,27 +69,34 @@ class SceneTimer(SubscribeInteractComponent):
 
             # Start new timer with buffer duration
             def timer_expired():
-                print(f"Scene timer expired after {base_duration:.2f}s")
+                # cancel() can lose the race with a timer that is already
+                # firing; only the most recently started timer may end a scene
+                with self.timer_lock:
+                    if self.last_timer_id != timer_id:
+                        return
+                logger.info("Scene timer expired after %.2fs", base_duration)
                 timer_event = TimerExpired(
                     timer_id=timer_id, duration=base_duration
                 )  # Use original duration in event
                 try:
-                    interaction_socket.send_string(timer_event.model_dump_json())
-                except Exception as e:
-                    print(f"Error sending timer expired event: {e}")
+                    interaction_socket.send(to_json(timer_event))
+                except Exception:
+                    logger.error("Error sending timer expired event", exc_info=True)
 
             self.current_timer = threading.Timer(buffer_duration, timer_expired)
             self.current_timer.daemon = True
             self.current_timer.start()
 
-            print(f"Scene timer started for {buffer_duration:.2f}s (ID: {timer_id})")
+            logger.info(
+                "Scene timer started for %.2fs (ID: %s)", buffer_duration, timer_id
+            )
 
     def stop_timer(self):
         """Stop current timer"""
         with self.timer_lock:
             if self.current_timer and self.current_timer.is_alive():
                 self.current_timer.cancel()
-                print("Scene timer stopped")
+                logger.info("Scene timer stopped")
                 self.last_timer_id = None
 
 
@@ -2,15 +2,15 @@ import logging
 import os
 from argparse import ArgumentParser
 import threading
-from pathlib import Path
 import time
-from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional
 
 import zmq
 from pydantic import BaseModel
+from pydantic_core import to_json
 
-from xwalk2.models import Heartbeat, parse_message
+from xwalk2.models import Heartbeat, parse_message, topic
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +40,15 @@ class HeartbeatSender:
         try:
             while not self.stop_event.is_set():
                 msg = Heartbeat(
-                    host=self.host, component=self.component, sent_at=datetime.now(), initial=(initial <= 2)
-                ).model_dump_json()
+                    host=self.host, component=self.component, sent_at=time.time(), initial=(initial <= 2)
+                )
                 if initial <= 2:
                     initial += 1
-                socket.send_string(msg)
-                time.sleep(self.every_s)
+                # Serialize straight to bytes rather than via a str.
+                socket.send(to_json(msg))
+                # Wakes early when stop() is called instead of sleeping out
+                # the full interval.
+                self.stop_event.wait(self.every_s)
         finally:
             socket.close(0)
             # Do not call context.term() — it's global
@@ -63,9 +66,9 @@ class HeartbeatSender:
         if self._started:
             self.stop_event.set()
             if self.thread:
-                # Actually wait for the beat loop to notice stop_event and exit
-                # (it sleeps up to every_s between beats). join(0) returned
-                # immediately and left the non-daemon thread running.
+                # Actually wait for the beat loop to notice stop_event and exit.
+                # join(0) returned immediately and left the non-daemon thread
+                # running.
                 self.thread.join(timeout=self.every_s + 1)
             self._started = False
 
@@ -77,7 +80,38 @@ class HeartbeatSender:
         self.stop()
 
 
+def subscribe(socket: zmq.Socket, message_types: Optional[List[str]]) -> None:
+    """Subscribe to the given message types, or to everything if None.
+
+    Filtering happens in ZMQ, so unwanted messages are never handed to Python.
+    """
+    if message_types is None:
+        socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        return
+    for msg_type in message_types:
+        socket.setsockopt_string(zmq.SUBSCRIBE, topic(msg_type))
+
+
+def recv_burst(socket: zmq.Socket) -> List[bytes]:
+    """Block for one message, then take every message already queued behind it.
+
+    Messages stay as bytes; parse_message validates them without decoding.
+    """
+    messages = [socket.recv()]
+    while True:
+        try:
+            messages.append(socket.recv(zmq.NOBLOCK))
+        except zmq.Again:
+            return messages
+
+
 class SubscribeComponent:
+    # Message types to receive from the controller; None receives everything.
+    message_types: Optional[List[str]] = None
+    # Only act on the newest message of a burst. For components whose output
+    # is just the latest state (e.g. a light) the older ones are superseded.
+    latest_only: bool = False
+
     def __init__(
         self,
         component_name: str,
@@ -94,10 +128,12 @@ class SubscribeComponent:
         raise NotImplementedError()
 
     def run(self):
-        context = zmq.Context()
+        # Process-wide context shared with the heartbeat thread; it is never
+        # term()'d here because that would block on the heartbeat's socket.
+        context = zmq.Context.instance()
         socket = context.socket(zmq.SUB)
         socket.connect(self.subscribe_address)
-        socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        subscribe(socket, self.message_types)
 
         with HeartbeatSender(
             self.component_name,
@@ -106,24 +142,26 @@ class SubscribeComponent:
         ):
             try:
                 while True:
-                    msg = socket.recv_string()
-                    # Don't let a single malformed message or missing asset
-                    # (e.g. KeyError from an unknown gif/audio name) tear down
-                    # the whole component.
-                    try:
-                        message = parse_message(msg)
-                        self.process_message(message)
-                    except Exception:
-                        logger.exception(
-                            "%s failed to handle message: %s",
-                            self.component_name,
-                            msg,
-                        )
+                    messages = recv_burst(socket)
+                    if self.latest_only:
+                        messages = messages[-1:]
+                    for msg in messages:
+                        # Don't let a single malformed message or missing asset
+                        # (e.g. KeyError from an unknown gif/audio name) tear
+                        # down the whole component.
+                        try:
+                            message = parse_message(msg)
+                            self.process_message(message)
+                        except Exception:
+                            logger.exception(
+                                "%s failed to handle message: %s",
+                                self.component_name,
+                                msg,
+                            )
             except KeyboardInterrupt:
                 print(f"\nShutting down {self.component_name}")
             finally:
                 socket.close(0)
-                context.term()
 
 
 class InteractComponent:
@@ -143,11 +181,21 @@ class InteractComponent:
         raise NotImplementedError()
 
     def send_action(self, action: BaseModel):
-        self.socket.send_string(action.model_dump_json())
+        # Serialize straight to bytes rather than via a str. A PUB socket
+        # never blocks or raises here: with no connected controller, or at
+        # the high-water mark, the message is dropped silently.
+        self.socket.send(to_json(action))
 
     def run(self):
-        context = zmq.Context()
+        # Shared with the heartbeat thread (see SubscribeComponent.run).
+        context = zmq.Context.instance()
         self.socket = context.socket(zmq.PUB)
+        # Interactions are only meaningful now: don't queue them up while
+        # the controller is unreachable and replay them when it returns.
+        # They are dropped instead, without any error or log.
+        self.socket.setsockopt(zmq.SNDHWM, 4)
+        self.socket.setsockopt(zmq.IMMEDIATE, 1)
+        self.socket.setsockopt(zmq.LINGER, 0)
         self.socket.connect(self.interact_address)
 
         with HeartbeatSender(self.component_name, self.host_name, self.heartbeat_address):
@@ -157,10 +205,12 @@ class InteractComponent:
                 print(f"\nShutting down {self.component_name}")
             finally:
                 self.socket.close(1)
-                context.term()
 
 
 class SubscribeInteractComponent:
+    # Message types to receive from the controller; None receives everything.
+    message_types: Optional[List[str]] = None
+
     def __init__(
         self,
         component_name: str,
@@ -179,36 +229,36 @@ class SubscribeInteractComponent:
         raise NotImplementedError()
 
     def run(self):
-        context = zmq.Context()
+        # Shared with the heartbeat thread (see SubscribeComponent.run).
+        context = zmq.Context.instance()
 
         self.interact_socket = context.socket(zmq.PUB)
         self.interact_socket.connect(self.interact_address)
 
         subscribe_socket = context.socket(zmq.SUB)
         subscribe_socket.connect(self.subscribe_address)
-        subscribe_socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        subscribe(subscribe_socket, self.message_types)
 
         with HeartbeatSender(self.component_name, self.host_name, self.heartbeat_address):
             try:
                 while True:
-                    msg = subscribe_socket.recv_string()
-                    # Don't let a single malformed message or missing asset
-                    # tear down the whole component.
-                    try:
-                        message = parse_message(msg)
-                        self.process_message(message)
-                    except Exception:
-                        logger.exception(
-                            "%s failed to handle message: %s",
-                            self.component_name,
-                            msg,
-                        )
+                    for msg in recv_burst(subscribe_socket):
+                        # Don't let a single malformed message or missing asset
+                        # tear down the whole component.
+                        try:
+                            message = parse_message(msg)
+                            self.process_message(message)
+                        except Exception:
+                            logger.exception(
+                                "%s failed to handle message: %s",
+                                self.component_name,
+                                msg,
+                            )
             except KeyboardInterrupt:
                 print(f"\nShutting down {self.component_name}")
             finally:
                 subscribe_socket.close(0)
                 self.interact_socket.close(0)
-                context.term()
 
 
 class FileLibrary: